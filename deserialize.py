@@ -11,16 +11,15 @@ if len(sys.argv) > 3:
 	typeDirs = sys.argv[3:]
 
 blueprintFile = sys.argv[1]
-blueprint = jsonbp.loadFile(blueprintFile, typeDirs)
+blueprint = jsonbp.load_file(blueprintFile, custom_types=typeDirs)
 print(blueprint)
 
 jsonFile = sys.argv[2]
-with open(jsonFile, "r") as fd:
-	success, result = blueprint.deserialize(fd.read())
-	print(f'Success: {success}')
-	print(f'Result: {result}')
+success, result = blueprint.deserialize_file(jsonFile)
+print(f'Success: {success}')
+print(f'Result: {result}')
 
-	if success:
-		original = blueprint.serialize(result)
-		print(f'Original: {original}')
+if success:
+	original = blueprint.serialize(result)
+	print(f'Original: {original}')
 
@@ -1,11 +1,16 @@
 
 import os
 
-from .types import unquoted_str, ErrorType
-from .parser import load_file, load_string, invalidate_cache
+from .types import unquoted_str, ErrorType, EnumOutput, ObjectOutput
+from .parser import load_file, load_string, invalidate_cache, set_cache_size, cache_statistics
+from .parser import blueprint_ref
 from .exception import SchemaViolation, SerializationException
 from .error import use_default_language, load_translation, DeserializationError
 from .blueprint import JsonBlueprint
+from .backend import JsonBackend, register_json_backend, use_json_backend
+from .object import JsonRecord
+from .report import LoadReport
+from .watcher import watch_blueprints
 
 
 jsonbp_path = os.path.dirname(__file__)
@@ -22,10 +27,16 @@ for filename in os.listdir(localizationPath):
 __all__ = [
 	"load_file",
 	"load_string",
+	"blueprint_ref",
 	"invalidate_cache",
+	"set_cache_size",
+	"cache_statistics",
+	"watch_blueprints",
 	"SchemaViolation",
 	"SerializationException",
 	"use_default_language",
-	"load_translation"
+	"load_translation",
+	"register_json_backend",
+	"use_json_backend"
 ]
 
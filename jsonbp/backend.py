@@ -0,0 +1,236 @@
+
+import re
+import json
+import secrets
+from .types import unquoted_str
+
+#-------------------------------------------------------------------------------
+
+# as taken from
+# https://stackoverflow.com/a/62395407/21680913
+
+def no_bool_converter(pairs):
+	return { key: unquoted_str(str(value).lower())
+		if isinstance(value, bool) else value
+		for key, value in pairs
+	}
+
+identity = lambda x : x
+unquote = lambda x : unquoted_str(x)
+
+#-------------------------------------------------------------------------------
+
+# text that has to reach the output verbatim (Decimals keeping their
+# digits, NaN, Infinity) travels through the encoders as a string
+# wrapped in NUL characters and a per process nonce, which encoders
+# escape as \u0000 and no user string can forge. Text the encoders
+# leave untouched is then unwrapped by plain replacements, anything
+# else (quotes, backslashes, control characters) by unescaping it.
+
+_nonce = secrets.token_hex(8)
+_rawOpening = f"\x00{_nonce}:"
+_rawClosing = f"\x00{_nonce}"
+_rawEncoded = f'"\\u0000{_nonce}:'
+_rawEncodedClosing = f'\\u0000{_nonce}"'
+
+_escapedOpening = f"\x00{_nonce}!"
+_escapedEncoded = f'"\\u0000{_nonce}!'
+_escapedPattern = re.compile(r'"\\u0000' + _nonce + r'!(.*?)\\u0000' + _nonce + '"')
+
+def raw_json(text):
+	if '"' in text or '\\' in text or not text.isprintable():
+		return f"{_escapedOpening}{text}{_rawClosing}"
+
+	return f"{_rawOpening}{text}{_rawClosing}"
+
+
+def fragment_value(fragment):
+	"""Turns the JSON text made by a type formatter into a value encoders
+	accept: strings are unquoted, anything else is kept verbatim."""
+
+	if fragment[:1] == '"':
+		if '\\' in fragment:
+			return json.loads(fragment)
+
+		return fragment[1:-1]
+
+	return raw_json(fragment)
+
+
+def number_value(text):
+	"""Like fragment_value for numbers, but a float is handed to the
+	encoders whenever they write it back as the very same text."""
+
+	# beyond the fixed notation, encoders write exponents differently
+	if 'e' in text or 'E' in text:
+		return raw_json(text)
+
+	try: value = float(text)
+	except ValueError:
+		return raw_json(text)
+
+	if repr(value) == text:
+		return value
+
+	return f"{_rawOpening}{text}{_rawClosing}"
+
+
+def _unescaped(match):
+	return json.loads(f'"{match.group(1)}"')
+
+
+def unwrap_raw(encoded):
+	# both kinds end alike, escaped text has to go first
+	if _escapedEncoded in encoded:
+		encoded = _escapedPattern.sub(_unescaped, encoded)
+
+	if _rawEncoded in encoded:
+		encoded = (encoded
+			.replace(_rawEncoded, '')
+			.replace(_rawEncodedClosing, ''))
+
+	return encoded
+
+#-------------------------------------------------------------------------------
+
+class JsonBackend:
+	"""Library used to turn JSON text into Python data.
+
+	Backends must decode numbers into :class:`jsonbp.unquoted_str` holding
+	their original text (so Decimals keep every digit), booleans inside
+	objects into unquoted_str('true') / unquoted_str('false'), and the
+	constants NaN and Infinity into plain strings. Malformed contents must
+	raise :class:`json.JSONDecodeError`.
+
+	Encoding receives a tree of dicts, lists, strings, numbers, booleans
+	and None, already checked against the blueprint. Backends that don't
+	override :meth:`encode` use the standard library's encoder.
+	"""
+
+	name = None
+
+	def decode(self, contents):
+		raise NotImplementedError
+
+	def encode(self, tree, indent=None):
+		separators = (',', ':') if indent is None else (',', ': ')
+		return json.dumps(tree, indent=indent, separators=separators,
+			ensure_ascii=False, check_circular=False)
+
+
+class StdlibBackend(JsonBackend):
+	name = 'json'
+
+	def decode(self, contents):
+		return json.loads(contents,
+			object_pairs_hook=no_bool_converter,
+			parse_float=unquote, parse_int=unquote,
+			parse_constant=identity)
+
+
+class SimplejsonBackend(JsonBackend):
+	name = 'simplejson'
+
+	def __init__(self, simplejson):
+		self.library = simplejson
+
+	def decode(self, contents):
+		try:
+			return self.library.loads(contents,
+				object_pairs_hook=no_bool_converter,
+				parse_float=unquote, parse_int=unquote,
+				parse_constant=identity)
+
+		except self.library.JSONDecodeError as e:
+			raise json.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
+class OrjsonBackend(StdlibBackend):
+	"""orjson can't keep the text of numbers, so it only encodes."""
+
+	name = 'orjson'
+
+	def __init__(self, orjson):
+		self.library = orjson
+
+	def encode(self, tree, indent=None):
+		if indent not in (None, 2):
+			return super().encode(tree, indent)
+
+		option = self.library.OPT_INDENT_2 if indent == 2 else 0
+
+		# integers beyond 64 bits are refused by orjson
+		try: encoded = self.library.dumps(tree, option=option)
+		except self.library.JSONEncodeError:
+			return super().encode(tree, indent)
+
+		return encoded.decode('utf-8')
+
+#-------------------------------------------------------------------------------
+
+_backends = dict()
+_current = None
+
+def register_json_backend(backend):
+	"""Makes a :class:`JsonBackend` available for :func:`use_json_backend`.
+
+		Args:
+			backend (JsonBackend): the backend, registered under its name.
+
+		Returns:
+			Nothing
+
+	"""
+
+	_backends[backend.name] = backend
+
+
+def use_json_backend(name):
+	"""Selects which library decodes JSON before jsonbp validates it, and
+		encodes it in :meth:`JsonBlueprint.encode`.
+
+		The standard library's json module is used by default, simplejson
+		is registered as 'simplejson' and orjson (encoding only) as 'orjson'
+		when installed. Whatever the backend, results are the same.
+
+		Args:
+			name (str): name of a registered backend.
+
+		Raises:
+			ValueError: When no backend is registered with that name.
+
+		Returns:
+			Nothing
+
+	"""
+
+	global _current
+
+	if not name in _backends:
+		msg = f"Unknown JSON backend '{name}'"
+		raise ValueError(msg)
+
+	_current = _backends[name]
+
+
+def current_backend():
+	return _current
+
+#-------------------------------------------------------------------------------
+
+register_json_backend(StdlibBackend())
+use_json_backend(StdlibBackend.name)
+
+try: import simplejson
+except ImportError: # pragma: no cover
+	simplejson = None
+
+if simplejson is not None: # pragma: no cover
+	register_json_backend(SimplejsonBackend(simplejson))
+
+try: import orjson
+except ImportError: # pragma: no cover
+	orjson = None
+
+if orjson is not None: # pragma: no cover
+	register_json_backend(OrjsonBackend(orjson))
@@ -1,28 +1,74 @@
 
 import re
 import json
+import mmap
 import uuid
+import functools
+import itertools
 import collections.abc
 
 from .field import create_field
-from .types import ErrorType, FieldType, unquoted_str
+from .types import ErrorType, FieldType, EnumOutput, ObjectOutput, unquoted_str
 from .exception import SchemaViolation, SerializationException
-from .error import create_field_error, create_object_error, create_root_error
+from .error import create_field_error, create_object_error, create_root_error, create_rejection_error, ErrorCollector
 from .array import make_array, is_array
+from .object import is_record
+from .columns import create_column, finish_columns
+from .stream import ArrayStream
+from .backend import current_backend, no_bool_converter, identity, unquote
+from .backend import fragment_value, unwrap_raw
+from .metrics import BlueprintMetrics, instrument, uninstrument
 
 #-------------------------------------------------------------------------------
 
-# as taken from
-# https://stackoverflow.com/a/62395407/21680913
+def decode_buffer(contents):
+  # bytes-like contents are decoded straight from their buffer,
+  # detecting the encoding (and BOM) just like json.loads does
 
-def no_bool_converter(pairs):
-  return { key: unquoted_str(str(value).lower())
-    if isinstance(value, bool) else value
-    for key, value in pairs
-  }
+  try: view = memoryview(contents)
+  except TypeError: return contents
 
-identity = lambda x : x
-unquote = lambda x : unquoted_str(x)
+  encoding = json.detect_encoding(bytes(view[:4]))
+  return str(view, encoding)
+
+
+discard = lambda *args : None
+_absent = object()
+
+# content is walked the same way to assemble JSON text, or to build
+# the values the backend's encoder indents in encode()
+
+class JsonText:
+  null = 'null'
+  writer = 'formatter'
+
+  @staticmethod
+  def array(items):
+    inner = ",".join(items)
+    return f"[{inner}]"
+
+  @staticmethod
+  def object(members):
+    inner = ",".join([f'"{name}":{value}' for name, value in members])
+    return f"{{{inner}}}"
+
+  @staticmethod
+  def string(literal):
+    return f'"{literal}"'
+
+
+class JsonTree:
+  null = None
+  writer = 'preparer'
+  array = staticmethod(identity)
+  object = dict
+  string = staticmethod(identity)
+
+
+_stream_decoder = json.JSONDecoder(
+  object_pairs_hook=no_bool_converter,
+  parse_float=unquote, parse_int=unquote,
+  parse_constant=identity)
 
 #-------------------------------------------------------------------------------
 
@@ -39,6 +85,15 @@ class JsonBlueprint:
     self.enums = dict()
     self.objects = dict()
     self.root = None
+    self.enum_output = EnumOutput.LITERAL
+    self.object_output = ObjectOutput.DICT
+    self.build_output = True
+    self.metrics = None
+    self.load_report = None
+    self.path = None
+    self.fingerprint = None
+    self._checker = None
+    self._bind_serializers()
 
   def __str__(self): # pragma: no cover
     return (
@@ -51,23 +106,30 @@ class JsonBlueprint:
 
   #-----------------------------------------------------------------------------
 
-  def _validate_field(self, field_name, field_type, value):
+  def _resolve_simple(self, field_type):
     if field_type in self.primitive_types:
       specs = self.primitive_types[field_type]['defaults']
-      baseType = field_type
+      return specs, field_type
 
-    else:
-      specs = self._find_element_decl(field_type)
-      baseType = specs['__baseType__']
+    specs = self._find_element_decl(field_type)
+    return specs, specs['__baseType__']
+
+
+  def _validate_field(self, field_name, field_type, value):
+    specs, baseType = self._resolve_simple(field_type)
 
     try:
       deserializeMethod = self.primitive_types[baseType]['parser']
       success, outcome = deserializeMethod(value, specs)
 
       if not success:
+        if type(outcome) is tuple:
+          return False, create_rejection_error(field_name,
+            outcome, baseType)
+
         return False, create_field_error(field_name,
-          outcome["error"], type=baseType,
-          **outcome["context"])
+          outcome["error"], outcome["context"],
+          type=baseType)
 
       return success, outcome
 
@@ -82,24 +144,51 @@ class JsonBlueprint:
         ErrorType.INVALID_ENUM, value=value)
 
     possibleValues = self._find_enum_decl(enum_type)
+    outputs = possibleValues.outputs(self.enum_output)
+
+    try: mapped = outputs.get(value, None)
+    except TypeError: mapped = None
 
-    if not value in possibleValues:
+    if mapped is None:
       return False, create_field_error(field_name,
         ErrorType.UNKNOWN_LITERAL, value=value)
 
-    return True, value
+    return True, mapped
 
 
-  def _validate_array(self, field_name, jArray, contents):
+  def _check_array(self, field_name, jArray, contents):
+    # problems with the array itself, None when there are none
+
     if not isinstance(contents, collections.abc.Sequence):
-      return False, create_field_error(field_name,
+      return create_field_error(field_name,
         ErrorType.INVALID_ARRAY)
 
     array_len = len(contents)
     if not jArray.minLength <= array_len <= jArray.maxLength:
-      return False, create_field_error(field_name,
+      return create_field_error(field_name,
         ErrorType.INVALID_LENGTH, length=array_len)
 
+    return None
+
+
+  def _validate_array(self, field_name, jArray, contents, errors=None):
+    array_error = self._check_array(field_name, jArray, contents)
+    if array_error is not None:
+      return False, array_error
+
+    array_kind = jArray.fieldKind
+    array_type = jArray.fieldType
+
+    if array_kind == FieldType.SIMPLE and not jArray.nullable:
+      batch = self._parse_batch(array_type, contents)
+      if batch is not None:
+        return True, batch
+
+    return self._validate_elements(field_name, jArray,
+      contents, errors)
+
+
+  def _validate_elements(self, field_name, jArray, contents, errors=None):
     array_kind = jArray.fieldKind
     array_type = jArray.fieldType
 
@@ -109,129 +198,278 @@ class JsonBlueprint:
 
     if array_kind == FieldType.OBJECT:
       element_type = self._find_object_decl(array_type)
-      deserializer = self._validate_object
+      deserializer = (self._validate_object if errors is None
+        else functools.partial(self._validate_object, errors=errors))
+
+    result = list() if self.build_output else None
+    append = result.append if self.build_output else discard
+
+    if errors is None:
+      for idx, value in enumerate(contents):
+        if value is None:
+          if jArray.nullable:
+            append(None)
+            continue
+
+          field_error = create_object_error(field_name,
+            ErrorType.NULL_VALUE, field=field_name)
+          field_error.push_path(idx)
+          return False, field_error
+
+        success, outcome = deserializer(
+          field_name,
+          element_type,
+          value)
+
+        if not success:
+          field_error = outcome
+          field_error.set_as_array_index(idx)
+          field_error.push_path(idx)
+          return False, field_error
 
-    result = list()
+        processed = outcome
+        append(processed)
+
+      return True, result
+
+    # collecting errors, validation goes on past failures
+
+    failed = False
     for idx, value in enumerate(contents):
       if value is None:
         if jArray.nullable:
-          result.append(None)
+          append(None)
           continue
 
-        return False, create_object_error(field_name,
+        success, outcome = False, create_object_error(field_name,
           ErrorType.NULL_VALUE, field=field_name)
 
-      success, outcome = deserializer(
-        field_name,
-        element_type,
-        value)
+      else:
+        mark = len(errors) if errors is not None else 0
+        success, outcome = deserializer(
+          field_name,
+          element_type,
+          value)
 
-      if not success:
-        field_error = outcome
-        field_error.set_as_array_index(idx)
-        return False, field_error
+      if success:
+        processed = outcome
+        append(processed)
+        continue
 
-      processed = outcome
-      result.append(processed)
+      # errors from nested objects were already collected,
+      # but still need to point to this array's index
 
-    return True, result
+      failed = True
+      if outcome is not None:
+        if value is not None: outcome.set_as_array_index(idx)
+        outcome.push_path(idx)
+        errors.add(outcome)
+
+      else:
+        errors.set_as_array_index(mark, idx)
+        errors.push_path(mark, idx)
+
+      if errors.full:
+        return False, None
+
+    return (True, result) if not failed else (False, None)
+
+
+  def _parse_batch(self, field_type, contents):
+    # converts and range checks the whole array at once, giving
+    # up (None) whenever the element-wise path is needed, either
+    # because the type has no batch parser or something is off
+    # and the offending index must be located
+
+    specs, baseType = self._resolve_simple(field_type)
+    batchMethod = self.primitive_types[baseType].get('batch_parser')
+    if batchMethod is None:
+      return None
+
+    try: return batchMethod(contents, specs)
+    except Exception: return None
 
 
-  def _validate_object(self, object_name, objectInstance, contents):
+  def _validate_object(self, object_name, objectInstance, contents, store=None, errors=None):
     if not isinstance(contents, collections.abc.Mapping):
       return False, create_object_error(object_name,
         ErrorType.INVALID_OBJECT)
 
-    result = dict()
+    if store is not None:
+      result = None
+
+    elif not self.build_output:
+      result = None
+      store = discard
+
+    elif self.object_output == ObjectOutput.RECORD:
+      record_type = objectInstance.record_type
+      result = record_type.__new__(record_type)
+      store = result.__setattr__
+
+    else:
+      result = dict()
+      store = result.__setitem__
+
+    # members are validated inline until the first failure, collecting
+    # errors (or counting each member for metrics) takes the long way
+
+    if errors is not None or self.metrics is not None:
+      return self._validate_members(object_name, objectInstance,
+        contents, store, result, errors)
+
     for field_name, field_data in objectInstance.items():
       if not field_name in contents:
         if field_data.optional:
           continue
 
-        return False, create_object_error(object_name,
+        field_error = create_object_error(object_name,
           ErrorType.MISSING_FIELD, field=field_name)
+        field_error.push_path(field_name)
+        return False, field_error
 
       retrieved = contents[field_name]
 
       if is_array(field_data):
         if retrieved is None:
           if field_data.nullableArray:
-            result[field_name] = None
+            store(field_name, None)
             continue
 
-          else:
-            return False, create_object_error(object_name,
-              ErrorType.NULL_VALUE, field=field_name)
+          field_error = create_object_error(object_name,
+            ErrorType.NULL_VALUE, field=field_name)
+          field_error.push_path(field_name)
+          return False, field_error
 
         success, outcome = self._validate_array(
           field_name, field_data,
           retrieved)
 
-        if not success:
-          field_error = outcome
-          return False, field_error
-
-        processed = outcome
-        result[field_name] = processed
-        continue
-
-      if retrieved is None:
+      elif retrieved is None:
         if field_data.nullable:
-          result[field_name] = None
+          store(field_name, None)
           continue
 
-        return False, create_object_error(object_name,
+        field_error = create_object_error(object_name,
           ErrorType.NULL_VALUE, field=field_name)
+        field_error.push_path(field_name)
+        return False, field_error
 
-      field_kind = field_data.fieldKind
-      field_type = field_data.fieldType
+      else:
+        field_kind = field_data.fieldKind
+        field_type = field_data.fieldType
 
-      if field_kind == FieldType.OBJECT:
-        objectSpecs = self._find_object_decl(field_type)
-        success, outcome = self._validate_object(
-          field_name, objectSpecs,
-          retrieved)
+        if field_kind == FieldType.OBJECT:
+          objectSpecs = self._find_object_decl(field_type)
+          success, outcome = self._validate_object(
+            field_name, objectSpecs,
+            retrieved)
 
-        if not success:
-          field_error = outcome
-          return False, field_error
+        elif field_kind == FieldType.ENUM:
+          success, outcome = self._validate_enum(
+            field_name, field_type,
+            retrieved)
 
-        processed = outcome
-        result[field_name] = processed
-        continue
+        else:
+          success, outcome = self._validate_field(
+            field_name, field_type,
+            retrieved)
 
-      if field_kind == FieldType.ENUM:
-        success, outcome = self._validate_enum(
-          field_name, field_type,
-          retrieved)
+      if not success:
+        field_error = outcome
+        field_error.push_path(field_name)
+        return False, field_error
 
-        if not success:
-          field_error = outcome
-          return False, field_error
+      processed = outcome
+      store(field_name, processed)
 
-        processed = outcome
-        result[field_name] = processed
+    return True, result
+
+
+  def _validate_members(self, object_name, objectInstance, contents, store, result, errors):
+    failed = False
+    for field_name, field_data in objectInstance.items():
+      if field_name in contents:
+        mark = len(errors) if errors is not None else 0
+        success, outcome = self._validate_member(object_name,
+          field_name, field_data, contents[field_name],
+          errors)
+
+      elif field_data.optional:
         continue
 
-      success, outcome = self._validate_field(
-        field_name, field_type,
-        retrieved)
+      else:
+        success, outcome = False, create_object_error(object_name,
+          ErrorType.MISSING_FIELD, field=field_name)
 
-      if not success:
+      if success:
+        processed = outcome
+        store(field_name, processed)
+        continue
+
+      if errors is None:
         field_error = outcome
+        field_error.push_path(field_name)
         return False, field_error
 
-      processed = outcome
-      result[field_name] = processed
+      failed = True
+      if outcome is not None:
+        outcome.push_path(field_name)
+        errors.add(outcome)
 
-    return True, result
+      else:
+        errors.push_path(mark, field_name)
+
+      if errors.full:
+        return False, None
+
+    return (True, result) if not failed else (False, None)
+
+
+  def _validate_member(self, object_name, field_name, field_data, retrieved, errors):
+    if is_array(field_data):
+      if retrieved is None:
+        if field_data.nullableArray:
+          return True, None
+
+        return False, create_object_error(object_name,
+          ErrorType.NULL_VALUE, field=field_name)
 
+      return self._validate_array(
+        field_name, field_data,
+        retrieved, errors)
 
-  def validate(self, root_contents):
+    if retrieved is None:
+      if field_data.nullable:
+        return True, None
+
+      return False, create_object_error(object_name,
+        ErrorType.NULL_VALUE, field=field_name)
+
+    field_kind = field_data.fieldKind
+    field_type = field_data.fieldType
+
+    if field_kind == FieldType.OBJECT:
+      objectSpecs = self._find_object_decl(field_type)
+      return self._validate_object(
+        field_name, objectSpecs,
+        retrieved, errors=errors)
+
+    if field_kind == FieldType.ENUM:
+      return self._validate_enum(
+        field_name, field_type,
+        retrieved)
+
+    return self._validate_field(
+      field_name, field_type,
+      retrieved)
+
+
+  def validate(self, root_contents, errors=None):
     if is_array(self.root):
       if root_contents is not None:
         return self._validate_array(None, self.root,
-          root_contents)
+          root_contents, errors)
 
         if self.root.nullableArray:
           return True, None
@@ -254,7 +492,7 @@ class JsonBlueprint:
     if root_kind == FieldType.OBJECT:
       root_object = self._find_object_decl(root_type)
       return self._validate_object(None, root_object,
-        root_contents)
+        root_contents, errors=errors)
 
     if root_kind == FieldType.ENUM:
       return self._validate_enum(None, root_type,
@@ -265,7 +503,7 @@ class JsonBlueprint:
         root_contents)
 
 
-  def deserialize(self, contents):
+  def deserialize(self, contents, max_errors=None):
     """Attempts to deserialize a JSON string into a Python object.
 
     The returned tuple's first element indicates whether the deserialization
@@ -274,8 +512,60 @@ class JsonBlueprint:
     element will be False and the second element will be an instance of
     :class:`DeserializationError`.
 
+    When `max_errors` is given, validation carries on after a problem is
+    found, and on failure the second element is instead a list with up to
+    `max_errors` instances of :class:`DeserializationError`, in document
+    order. Validation stops as soon as that many problems were found.
+
+    Args:
+      contents (str | bytes-like): JSON string to deserialize into Python
+        data. bytes, bytearray, memoryview and mmap objects are decoded
+        directly, detecting their encoding (UTF-8 by default) and BOM.
+      max_errors (int): how many problems to collect before giving up.
+
+    Returns:
+      Tuple[bool, object]
+
+    """
+
+    if self.root is None:
+      msg = "No root defined for blueprint, unable to deserialize"
+      raise SchemaViolation(msg)
+
+    if max_errors is None:
+      success, outcome = self._decode(contents)
+      if not success:
+        return False, outcome
+
+      return self.validate(outcome)
+
+    errors = ErrorCollector(max_errors)
+    success, outcome = self._decode(contents)
+    if not success:
+      return False, [outcome]
+
+    success, outcome = self.validate(outcome, errors)
+    if success:
+      return True, outcome
+
+    if outcome is not None:
+      errors.add(outcome)
+
+    return False, errors.errors
+
+
+  def deserialize_file(self, filepath, max_errors=None):
+    """Deserializes the contents of a JSON file into a Python object.
+
+    The file is memory mapped instead of read. When the root is an array,
+    its elements are decoded and validated one at a time, so the text of
+    the file is never fully loaded. In this case, problems within elements
+    are reported before the array length is checked. Results are the same
+    as those of :func:`deserialize`.
+
     Args:
-      contents (str): JSON string to deserialize into Python data.
+      filepath (str): path of the JSON file.
+      max_errors (int): how many problems to collect before giving up.
 
     Returns:
       Tuple[bool, object]
@@ -286,17 +576,206 @@ class JsonBlueprint:
       msg = "No root defined for blueprint, unable to deserialize"
       raise SchemaViolation(msg)
 
+    with open(filepath, "rb") as fd:
+      try: mapped = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+      except ValueError: # empty files can't be mapped
+        return self.deserialize(b'', max_errors)
+
+    with mapped:
+      if is_array(self.root) and ArrayStream.supports(mapped):
+        return self._deserialize_stream(mapped, max_errors)
+
+      return self.deserialize(mapped, max_errors)
+
+
+  def _deserialize_stream(self, mapped, max_errors):
+    errors = (ErrorCollector(max_errors)
+      if max_errors is not None else None)
+
+    jArray = self.root
+    stream = ArrayStream(mapped, _stream_decoder)
+
+    try:
+      elements = iter(stream)
+      limited = itertools.islice(elements, jArray.maxLength)
+      success, outcome = self._validate_elements(None, jArray,
+        limited, errors)
+
+      if success:
+        array_len = len(outcome) + sum(1 for _ in elements)
+        if not jArray.minLength <= array_len <= jArray.maxLength:
+          success, outcome = False, create_field_error(None,
+            ErrorType.INVALID_LENGTH, length=array_len)
+
+    except json.JSONDecodeError as e:
+      success, outcome = False, create_root_error(ErrorType.JSON_PARSING,
+        line=e.lineno, column=e.colno, message=e.msg)
+
+    except UnicodeDecodeError as e:
+      success, outcome = False, create_root_error(ErrorType.JSON_PARSING,
+        line=stream.line, column=stream.column, message=e.reason)
+
+    finally:
+      stream.close()
+
+    if success or errors is None:
+      return success, outcome
+
+    if outcome is not None:
+      errors.add(outcome)
+
+    return False, errors.errors
+
+
+  def check(self, contents):
+    """Checks whether a JSON string conforms to the blueprint.
+
+    The same rules of :func:`deserialize` are applied, but the dicts
+    (or records) and lists holding the content aren't assembled. This
+    spares their memory, not much time: checking a value's range or
+    format takes converting it, so values are still converted one by
+    one (arrays of types with a batch parser, Integer and Float, into a
+    list at once) and dropped right away, which leaves check() about
+    as fast as :func:`deserialize`.
+
+    Args:
+      contents (str | bytes-like): JSON string to verify.
+
+    Returns:
+      Tuple[bool, DeserializationError]: the error is None on success.
+
+    """
+
+    if self.root is None:
+      msg = "No root defined for blueprint, unable to check"
+      raise SchemaViolation(msg)
+
+    if self._checker is None:
+      checker = self._derive()
+      checker.build_output = False
+      checker.enum_output = EnumOutput.LITERAL
+      self._checker = checker
+
+    success, outcome = self._decode(contents)
+    if not success:
+      return False, outcome
+
+    success, outcome = self._checker.validate(outcome)
+    return success, (None if success else outcome)
+
+
+  def _decode(self, contents):
     try:
-      loaded = json.loads(contents,
-        object_pairs_hook=no_bool_converter,
-        parse_float=unquote, parse_int=unquote,
-        parse_constant=identity)
+      if not isinstance(contents, str):
+        contents = decode_buffer(contents)
+
+      loaded = current_backend().decode(contents)
 
     except json.JSONDecodeError as e:
       return False, create_root_error(ErrorType.JSON_PARSING,
         line=e.lineno, column=e.colno, message=e.msg)
 
-    return self.validate(loaded)
+    except UnicodeDecodeError as e:
+      return False, create_root_error(ErrorType.JSON_PARSING,
+        line=1, column=e.start + 1, message=e.reason)
+
+    return True, loaded
+
+  #----------------------------------------------------------------------------
+
+  def _create_columns(self, objectInstance):
+    columns = dict()
+    for field_name, field_data in objectInstance.items():
+      base_type = specs = None
+
+      if not is_array(field_data) and field_data.fieldKind == FieldType.SIMPLE:
+        specs = self._find_element_decl(field_data.fieldType)
+        base_type = specs.get('__baseType__', field_data.fieldType)
+
+      columns[field_name] = create_column(field_data, base_type, specs)
+
+    return columns
+
+
+  def _validate_columns(self, contents):
+    jArray = self.root
+
+    array_error = self._check_array(None, jArray, contents)
+    if array_error is not None:
+      return False, array_error
+
+    objectInstance = self._find_object_decl(jArray.fieldType)
+    columns = self._create_columns(objectInstance)
+    appenders = [(field_name, column.append)
+      for field_name, column in columns.items()]
+
+    # each element is stored into the same row, then moved to the columns,
+    # absent optional fields taking a None
+
+    row = dict()
+    store = row.__setitem__
+    take = row.get
+
+    for idx, value in enumerate(contents):
+      if value is None:
+        field_error = create_object_error(None,
+          ErrorType.NULL_VALUE, field=None)
+        field_error.push_path(idx)
+        return False, field_error
+
+      success, outcome = self._validate_object(None,
+        objectInstance, value, store)
+
+      if not success:
+        field_error = outcome
+        field_error.set_as_array_index(idx)
+        field_error.push_path(idx)
+        return False, field_error
+
+      for field_name, append in appenders:
+        append(take(field_name))
+
+      row.clear()
+
+    return True, finish_columns(columns)
+
+
+  def deserialize_columns(self, contents):
+    """Deserializes a JSON array of objects into columns.
+
+    Instead of one dict per element, the result maps each field of the
+    root object into a sequence holding that field's value for every
+    element. Mandatory, non nullable Integer, Float and Bool fields are
+    collected into :class:`array.array` buffers, exposed as NumPy arrays
+    when NumPy is installed. Other fields are collected into lists, with
+    absent optional fields represented by None.
+
+    Columns spare the memory and layout of a dict per element, not
+    time: elements are validated just like in :func:`deserialize`,
+    which is where most of it goes, so both take about as long.
+
+    Args:
+      contents (str | bytes-like): JSON string to deserialize into columns.
+
+    Returns:
+      Tuple[bool, object]
+
+    Raises:
+      SchemaViolation: when the root is not an array of objects.
+
+    """
+
+    root = self.root
+    if (not is_array(root) or root.fieldKind != FieldType.OBJECT
+      or root.nullable or root.nullableArray):
+      msg = "Columns require a root that is a non nullable array of objects"
+      raise SchemaViolation(msg)
+
+    success, outcome = self._decode(contents)
+    if not success:
+      return False, outcome
+
+    return self._validate_columns(outcome)
 
   #----------------------------------------------------------------------------
 
@@ -310,6 +789,11 @@ class JsonBlueprint:
     return collected
 
 
+  def _depends_on(self, path):
+    return any(source.path == path
+      for source in self._collect_sources())
+
+
   def _collect_types(self):
     collected = list()
     sources = self._collect_sources()
@@ -416,7 +900,7 @@ class JsonBlueprint:
       raise SchemaViolation(msg)
 
     root_field = create_field(root_kind, root_type)
-    result = JsonBlueprint(self.primitive_types)
+    result = self._derive()
     result.root = (make_array(root_field) if as_array else
       root_field)
 
@@ -424,6 +908,129 @@ class JsonBlueprint:
       if min_array_length: result.root.apply_spec('minLength', min_array_length)
       if max_array_length: result.root.apply_spec('maxLength', max_array_length)
 
+    return result
+
+
+  def with_output(self, enums=None, objects=None):
+    """Selects how deserialized values are represented.
+
+      Like :func:`choose_root`, this creates a derivative JsonBlueprint
+      instance and leaves the original one unchanged. Serialization of
+      the derived blueprint accepts the chosen representations back,
+      besides the literals themselves.
+
+      Args:
+        enums (EnumOutput): LITERAL keeps the JSON strings, MEMBER maps
+          each literal to a member of an :class:`enum.Enum` generated per
+          enum declaration and ORDINAL maps it to its position in the
+          declaration.
+        objects (ObjectOutput): DICT builds a dict per object while RECORD
+          fills an instance of a slotted class generated per object
+          declaration, whose fields are read through attribute access.
+
+      Returns:
+        A new blueprint, with the chosen output representations.
+
+      Raises:
+        SchemaViolation: when an output is invalid or a declaration can't
+          be mapped into the generated classes.
+
+    """
+
+    result = self._derive()
+
+    if enums is not None:
+      if not enums in (EnumOutput.LITERAL, EnumOutput.MEMBER, EnumOutput.ORDINAL):
+        msg = f"Invalid enum output '{enums}'"
+        raise SchemaViolation(msg)
+
+      # classes are generated now, so that unfit declarations are reported here
+      if EnumOutput.MEMBER == enums:
+        for source in self._collect_sources():
+          for declaration in source.enums.values():
+            declaration.python_enum
+
+      result.enum_output = enums
+
+    if objects is not None:
+      if not objects in (ObjectOutput.DICT, ObjectOutput.RECORD):
+        msg = f"Invalid object output '{objects}'"
+        raise SchemaViolation(msg)
+
+      if ObjectOutput.RECORD == objects:
+        for source in self._collect_sources():
+          for declaration in source.objects.values():
+            declaration.record_type
+
+      result.object_output = objects
+
+    return result
+
+
+  def type_statistics(self):
+    """Reports how the caches of primitive types are doing.
+
+      Types whose specs define 'statistics' (Instant and Date, whose
+      parsed and formatted values are memoized) are included. Memos
+      belong to the type, not to a blueprint: every blueprint loaded in
+      the process (includes and reloads too) shares them, and so do
+      their statistics.
+
+      Returns:
+        dict: maps each type name to the statistics it reports, for
+        Instant and Date the 'hits', 'misses' and 'size' of their
+        'parse' and 'format' memos.
+
+    """
+
+    return {name: specs['statistics']()
+      for name, specs in self.primitive_types.items()
+      if 'statistics' in specs}
+
+
+  def enable_metrics(self, callback=None):
+    """Starts gathering runtime metrics for this blueprint.
+
+      Calls of :func:`deserialize` (:func:`deserialize_file` included),
+      :func:`check`, :func:`serialize` and :func:`encode` are counted and
+      timed, as well as the validation and serialization of each object,
+      field and type within them (except for check), along with failures.
+      Blueprints derived afterwards (:func:`choose_root`, :func:`with_output`)
+      don't inherit metrics, and those without them pay nothing.
+
+      Args:
+        callback (callable): if given, called after each deserialize,
+          check, serialize or encode call with a dict holding 'operation',
+          'time' (seconds), 'bytes' (length of the JSON) and 'success'.
+
+      Returns:
+        BlueprintMetrics: also kept as the 'metrics' attribute, whose
+        snapshot() method returns every counter so far.
+
+    """
+
+    self.disable_metrics()
+    self.metrics = BlueprintMetrics(callback)
+    instrument(self, self.metrics)
+    return self.metrics
+
+
+  def disable_metrics(self):
+    """Stops gathering runtime metrics, discarding them."""
+
+    uninstrument(self)
+    self.metrics = None
+
+
+  def _derive(self):
+    result = JsonBlueprint(self.primitive_types)
+    result.root = self.root
+    result.enum_output = self.enum_output
+    result.object_output = self.object_output
+    result.load_report = self.load_report
+    result.path = self.path
+    result.fingerprint = self.fingerprint
+
     result.includes = self.includes
     result.derived_types = self.derived_types
     result.enums = self.enums
@@ -433,19 +1040,14 @@ class JsonBlueprint:
 
   #----------------------------------------------------------------------------
 
-  def _serialize_element(self, element, elementName, content):
+  def _serialize_element(self, element, elementName, content, output):
     contentKind = element.fieldKind
     contentType = element.fieldType
-
-    method = {
-      FieldType.OBJECT: JsonBlueprint._serialize_object,
-      FieldType.ENUM: JsonBlueprint._serialize_enum,
-      FieldType.SIMPLE: JsonBlueprint._serialize_field
-    } [contentKind]
+    method = self._serializers[contentKind]
 
     if is_array(element):
       if content is None:
-        if element.nullableArray: return 'null'
+        if element.nullableArray: return output.null
         msg = f"{elementName}: Array cannot be null"
         raise SerializationException(msg)
 
@@ -458,77 +1060,119 @@ class JsonBlueprint:
           f"from '{content_type}' value"
         )
 
-      serialized = list()
-      for idx, item in enumerate(content):
+      if contentKind == FieldType.SIMPLE and self.metrics is None:
+        # primitive values are written straight by their type (with
+        # metrics on, each of them is counted as any other field)
+        specs, write = self._field_writer(contentType, output)
+        items = list()
+
+        for item in iterator:
+          if item is not None:
+            items.append(write(item, specs))
+
+          elif element.nullable:
+            items.append(output.null)
+
+          else:
+            msg = f"{elementName} is not nullable"
+            raise SerializationException(msg)
+
+        return output.array(items)
+
+      # names only matter to the errors of enums and objects
+      named = contentKind != FieldType.SIMPLE
+
+      items = list()
+      for idx, item in enumerate(iterator):
         if item is None:
           if element.nullable:
-            serialized.append('null')
+            items.append(output.null)
             continue
 
           else:
             msg = f"{elementName} is not nullable"
             raise SerializationException(msg)
 
-        idxName = f"{elementName} index {idx}"
-        processed = method(self, contentType, idxName, item)
-        serialized.append(processed)
+        idxName = f"{elementName} index {idx}" if named else elementName
+        items.append(method(contentType, idxName, item, output))
 
-      inner = ",".join(serialized)
-      return f"[{inner}]"
+      return output.array(items)
 
     if content is None:
-      if element.nullable: return 'null'
+      if element.nullable: return output.null
       msg = f"{elementName} is not nullable"
       raise SerializationException(msg)
 
-    return method(self, contentType, elementName, content)
+    return method(contentType, elementName, content, output)
 
 
-  def _serialize_object(self, object_type, object_name, content):
+  def _serialize_object(self, object_type, object_name, content, output):
     objectInstance = self._find_object_decl(object_type)
 
-    if not isinstance(content, collections.abc.Mapping):
-      msg = f"{object_name} needs to receive a dict to serialize"
+    if isinstance(content, collections.abc.Mapping):
+      retrieve = content.get
+
+    elif is_record(content) or hasattr(content, '__dict__'):
+      retrieve = functools.partial(getattr, content)
+
+    else:
+      msg = f"{object_name} needs to receive a dict or a record to serialize"
       raise SerializationException(msg)
 
-    serialized = list()
+    members = list()
     for field_name, field_data in objectInstance.items():
-      if not field_name in content:
+      fieldValue = retrieve(field_name, _absent)
+
+      if fieldValue is _absent:
         if field_data.optional:
           continue
 
         msg = f"{object_name}: missing field {field_name}"
         raise SerializationException(msg)
 
-      fieldValue = content[field_name]
-      processed = self._serialize_element(field_data, field_name, fieldValue)
-      serialized.append(f'"{field_name}":{processed}')
+      processed = self._serialize_element(field_data, field_name, fieldValue, output)
+      members.append((field_name, processed))
 
-    inner = ",".join(serialized)
-    return f"{{{inner}}}"
+    return output.object(members)
 
 
-  def _serialize_enum(self, enum_type, field_name, content):
+  def _serialize_enum(self, enum_type, field_name, content, output):
     possibleValues = self._find_enum_decl(enum_type)
+    literal = possibleValues.literal(content, self.enum_output)
 
-    if not content in possibleValues:
+    if literal is None:
       msg = f"Value '{content}' is not valid for field '{field_name}'"
       raise SerializationException(msg)
 
-    return f'"{content}"'
+    return output.string(literal)
 
 
-  def _serialize_field(self, field_type, field_name, content):
-    if field_type in self.primitive_types:
-      specs = self.primitive_types[field_type]['defaults']
-      baseType = field_type
+  def _serialize_field(self, field_type, field_name, content, output):
+    specs, write = self._field_writer(field_type, output)
+    return write(content, specs)
+
+
+  def _field_writer(self, field_type, output):
+    specs, baseType = self._resolve_simple(field_type)
+    primitive = self.primitive_types[baseType]
+
+    write = primitive.get(output.writer)
+    if write is None:
+      # types without a preparer have their formatter output handed over
+      format_method = primitive['formatter']
+      write = lambda content, specs: fragment_value(format_method(content, specs))
+
+    return specs, write
 
-    else:
-      specs = self._find_element_decl(field_type)
-      baseType = specs['__baseType__']
 
-    serialize_method = self.primitive_types[baseType]['formatter']
-    return serialize_method(content, specs)
+  def _bind_serializers(self):
+    # resolved once, and again whenever metrics shadow the methods
+    self._serializers = {
+      FieldType.OBJECT: self._serialize_object,
+      FieldType.ENUM: self._serialize_enum,
+      FieldType.SIMPLE: self._serialize_field
+    }
+
 
   #-------------------------------------------------------------------------------
 
@@ -559,5 +1203,52 @@ class JsonBlueprint:
     return self._serialize_element(
       self.root,
       "Root Level",
-      content)
+      content,
+      JsonText)
+
+
+  def encode(self, content, indent=None):
+    """Serializes a Python object into a JSON string, which can also
+      be indented.
+
+      Content is checked and formatted just like in :meth:`serialize`.
+      Compact results are written the same way too, while indented ones
+      are written by the selected JSON backend's encoder (see
+      :func:`jsonbp.use_json_backend`), which fully escapes strings
+      (:meth:`serialize` only escapes double quotes).
+
+      Handing the values over to an encoder doesn't pay off for compact
+      output: serialize() already joins JSON text in C, the encoder would
+      only add a pass over an intermediate tree, taking more memory.
+
+      Args:
+        content (object): Python data to be transformed into
+          a JSON string.
+        indent (int): if given, spaces used to indent nested values,
+          otherwise the output is compact.
+
+      Returns:
+        the resulting JSON string
+
+      Raises:
+        SerializationException: when a field is missing in the
+          Python object or some field has an incompatible type.
+
+    """
+
+    if self.root is None:
+      msg = "No root defined for blueprint, unable to serialize"
+      raise SerializationException(msg)
+
+    output = JsonText if indent is None else JsonTree
+    serialized = self._serialize_element(
+      self.root,
+      "Root Level",
+      content,
+      output)
+
+    if output is JsonText:
+      return serialized
 
+    encoded = current_backend().encode(serialized, indent)
+    return unwrap_raw(encoded)
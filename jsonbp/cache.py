@@ -0,0 +1,130 @@
+
+import threading
+import collections
+
+class BlueprintCache:
+	"""Least recently used mapping of keys to loaded blueprints."""
+
+	def __init__(self, maxsize):
+		self._entries = collections.OrderedDict()
+		self._lock = threading.Lock()
+		self.resize(maxsize)
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __contains__(self, key):
+		return key in self._entries
+
+	def resize(self, maxsize):
+		if type(maxsize) is not int or maxsize < 0:
+			msg = f"Cache size needs to be a non negative integer, got '{maxsize}'"
+			raise ValueError(msg)
+
+		with self._lock:
+			self.maxsize = maxsize
+			self._shrink()
+
+	def get(self, key):
+		with self._lock:
+			found = self._entries.get(key)
+			if found is None:
+				self.misses += 1
+				return None
+
+			self._entries.move_to_end(key)
+			self.hits += 1
+			return found
+
+	def put(self, key, blueprint):
+		with self._lock:
+			self._entries[key] = blueprint
+			self._entries.move_to_end(key)
+			self._shrink()
+
+	def items(self):
+		with self._lock:
+			return list(self._entries.items())
+
+	def update(self, entries):
+		"""Puts all entries at once, as seen by other threads."""
+
+		with self._lock:
+			self._entries.update(entries)
+			for key in entries:
+				self._entries.move_to_end(key)
+
+			self._shrink()
+
+	def clear(self):
+		with self._lock:
+			self._entries.clear()
+
+	def evict(self, predicate):
+		"""Removes entries for which predicate(key, blueprint) holds."""
+
+		with self._lock:
+			doomed = [key for key, blueprint in self._entries.items()
+				if predicate(key, blueprint)]
+
+			for key in doomed:
+				del self._entries[key]
+
+			return len(doomed)
+
+	def statistics(self):
+		return {
+			'size': len(self._entries),
+			'maxsize': self.maxsize,
+			'hits': self.hits,
+			'misses': self.misses,
+			'evictions': self.evictions
+		}
+
+	def _shrink(self):
+		while len(self._entries) > self.maxsize:
+			self._entries.popitem(last=False)
+			self.evictions += 1
+
+#-------------------------------------------------------------------------------
+
+class BlueprintRef:
+	"""Handle to a cached blueprint, see :func:`jsonbp.blueprint_ref`."""
+
+	__slots__ = ('key', '_loader', '_blueprint', '_generation', '__weakref__')
+
+	def __init__(self, key, loader):
+		self.key = key
+		self._loader = loader
+		self._blueprint = None
+		self._generation = 0
+
+	def get(self):
+		"""Returns the current blueprint, loading it again if invalidated."""
+
+		blueprint = self._blueprint
+		if blueprint is None:
+			blueprint = self._refresh()
+
+		return blueprint
+
+	def _refresh(self):
+		# an invalidation while loading means the result may be stale
+		generation = self._generation
+		blueprint = self._loader()
+
+		if generation == self._generation:
+			self._blueprint = blueprint
+
+		return blueprint
+
+	def _invalidate(self):
+		self._generation += 1
+		self._blueprint = None
+
+	def _replace(self, blueprint):
+		self._generation += 1
+		self._blueprint = blueprint
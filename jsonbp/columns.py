@@ -0,0 +1,55 @@
+
+from array import array
+
+try: import numpy
+except ImportError: # pragma: no cover
+	numpy = None
+
+_int64_min = -(1 << 63)
+_int64_max = (1 << 63) - 1
+
+# typecodes for the primitive types that fit contiguous buffers
+
+_typecodes = {
+	'Integer': 'q',
+	'Float': 'd',
+	'Bool': 'B'
+}
+
+_dtypes = {
+	'q': 'int64',
+	'd': 'float64',
+	'B': 'bool'
+}
+
+
+def create_column(field, base_type, specs):
+	"""Creates the container that accumulates the values of a field.
+
+	Mandatory, non nullable Integer, Float and Bool fields are kept in
+	an :class:`array.array`, everything else goes into a list.
+	"""
+
+	if field.optional or field.nullable:
+		return list()
+
+	typecode = _typecodes.get(base_type)
+	if typecode is None:
+		return list()
+
+	if 'q' == typecode:
+		if not _int64_min <= specs['min'] <= specs['max'] <= _int64_max:
+			return list()
+
+	return array(typecode)
+
+
+def finish_columns(columns):
+	"""Exposes typed columns as NumPy arrays, when NumPy is available."""
+
+	if numpy is None:
+		return columns
+
+	return {name: numpy.frombuffer(column, dtype=_dtypes[column.typecode])
+		if isinstance(column, array) else column
+		for name, column in columns.items()}
@@ -0,0 +1,92 @@
+
+import sys
+import enum
+
+from .types import EnumOutput
+from .exception import SchemaViolation
+
+class JsonEnum(frozenset):
+	"""Set of allowed literals for an enum, with O(1) membership.
+
+	The declaration order is kept in :attr:`constants` and every
+	constant is interned.
+	"""
+
+	__slots__ = ('constants', 'name', '_outputs', '_python_enum')
+
+	def __new__(cls, constants):
+		interned = tuple(dict.fromkeys(
+			sys.intern(constant) for constant in constants))
+
+		instance = frozenset.__new__(cls, interned)
+		instance.constants = interned
+		instance.name = None
+		instance._outputs = dict()
+		instance._python_enum = None
+		return instance
+
+	def __repr__(self): # pragma: no cover
+		return f"JsonEnum({self.constants})"
+
+	@property
+	def python_enum(self):
+		"""The :class:`enum.Enum` generated for this declaration."""
+
+		if self._python_enum is None:
+			try:
+				self._python_enum = enum.Enum(self.name or 'JsonEnum',
+					[(constant, constant) for constant in self.constants])
+
+			except (ValueError, TypeError) as e:
+				msg = f"Unable to map enum '{self.name}' to a Python Enum: {e}"
+				raise SchemaViolation(msg)
+
+		return self._python_enum
+
+	def outputs(self, enum_output):
+		"""Maps each literal into what deserialization should return."""
+
+		if enum_output in self._outputs:
+			return self._outputs[enum_output]
+
+		if EnumOutput.MEMBER == enum_output:
+			members = self.python_enum
+			mapping = {constant: members[constant]
+				for constant in self.constants}
+
+		elif EnumOutput.ORDINAL == enum_output:
+			mapping = {constant: index
+				for index, constant in enumerate(self.constants)}
+
+		else:
+			mapping = {constant: constant
+				for constant in self.constants}
+
+		self._outputs[enum_output] = mapping
+		return mapping
+
+	def literal(self, content, enum_output=EnumOutput.LITERAL):
+		"""Maps a literal back to itself and, when the enum is output as such,
+		a generated Enum member or an ordinal back to the respective literal,
+		returning None when it doesn't belong to the enum."""
+
+		if isinstance(content, str):
+			return content if content in self else None
+
+		if EnumOutput.MEMBER == enum_output:
+			if isinstance(content, enum.Enum) and type(content) is self._python_enum:
+				return content.value
+
+		elif EnumOutput.ORDINAL == enum_output:
+			if type(content) is int and 0 <= content < len(self.constants):
+				return self.constants[content]
+
+		return None
+
+#-------------------------------------------------------------------------------
+
+def create_enum(constants):
+	return JsonEnum(constants)
+
+def is_enum(decl):
+	return isinstance(decl, JsonEnum)
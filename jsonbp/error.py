@@ -1,4 +1,6 @@
 
+import string
+import functools
 import configparser
 from .types import ErrorType
 
@@ -25,6 +27,45 @@ fallback_language = "en_US"
 default_language = "en_US"
 translations = dict()
 
+_formatter = string.Formatter()
+
+def compile_template(template):
+	"""Turns a message template into a callable taking its values mapping."""
+
+	fields = [name for _, name, _, _ in _formatter.parse(template)
+		if name is not None]
+
+	if len(fields) == 0:
+		message = template.format()
+		return lambda values : message
+
+	return template.format_map
+
+
+# translations already chosen for the most recent tuples of language
+# priorities, cleared whenever the languages change
+
+@functools.lru_cache(maxsize=64)
+def _resolved(key):
+	candidates = (key
+		if key is not None
+		else [default_language])
+
+	for candidate in candidates:
+		translation = translations.get(candidate)
+		if translation is not None:
+			return translation
+
+	return translations[fallback_language]
+
+
+def resolve_translation(localization_priority):
+	key = (tuple(localization_priority)
+		if localization_priority is not None
+		else None)
+
+	return _resolved(key)
+
 def use_default_language(language):
 	"""Defines which language to use to map errors by default.
 
@@ -44,6 +85,7 @@ def use_default_language(language):
 
 	global default_language
 	default_language = language
+	_resolved.cache_clear()
 
 #-------------------------------------------------------------------------------
 
@@ -77,6 +119,7 @@ def load_translation(filename, language):
 
 	translation = translations.get(language, dict())
 	translations[language] = translation
+	_resolved.cache_clear()
 
 	config = configparser.ConfigParser()
 	config.read_string(contents)
@@ -92,7 +135,7 @@ def load_translation(filename, language):
 
 			if sanedEntry in _error_codes:
 				index = _error_codes[sanedEntry]
-				messages[index] = section[sanedEntry]
+				messages[index] = compile_template(section[sanedEntry])
 
 	if 'Prefixes' in sections:
 		prefixes = translation.get('prefixes', dict())
@@ -104,19 +147,81 @@ def load_translation(filename, language):
 
 			if sanedEntry in possible_prefixes:
 				prefixValue = section[sanedEntry]
-				prefixes[sanedEntry] = prefixValue
+				prefixes[sanedEntry] = compile_template(prefixValue)
 
 #-------------------------------------------------------------------------------
 
+# primitive types may report a failure as just (error_id, rejected value),
+# the context then being derived from that value once it's needed
+
+_unset = object()
+
+_rejectionContexts = {
+	ErrorType.OUTSIDE_RANGE: lambda value: {'value': value},
+	ErrorType.INVALID_LENGTH: lambda value: {'length': len(value)}
+}
+
 class DeserializationError:
 	"""Error returned from failed deserializations."""
 
-	def __init__(self, error_id, **context):
+	# the context is only assembled when someone reads it, failures
+	# themselves just keep references to what they were given (slots
+	# keep them small, while __dict__ still takes other attributes)
+
+	__slots__ = ('error_id', 'prefix', 'assignee', 'index',
+		'_context', '_rejected', '_extra', '_merged', '_segments',
+		'__dict__')
+
+	def __init__(self, error_id, context=None, **extra):
 		self.error_id = error_id
-		self.context = context
 		self.prefix = None
 		self.assignee = None
 		self.index = None
+		self._context = context
+		self._rejected = _unset
+		self._extra = extra
+		self._merged = None
+		self._segments = None
+
+	@property
+	def context(self):
+		if self._merged is None:
+			merged = dict(self._context) if self._context else dict()
+			if self._rejected is not _unset:
+				derive = _rejectionContexts.get(self.error_id)
+				if derive is not None:
+					merged.update(derive(self._rejected))
+
+			merged.update(self._extra)
+			self._merged = merged
+
+		return self._merged
+
+	@context.setter
+	def context(self, context):
+		self._context = context
+		self._rejected = _unset
+		self._extra = dict()
+		self._merged = context
+
+	@property
+	def path(self):
+		"""JSON pointer (RFC 6901) to the offending node, '' being the root."""
+
+		if self._segments is None:
+			return ''
+
+		return ''.join('/' + str(segment).replace('~', '~0').replace('/', '~1')
+			for segment in reversed(self._segments))
+
+	def push_path(self, segment):
+		# errors are created at the failing node and the path
+		# is unwound from there, so segments come in reverse
+
+		if self._segments is None:
+			self._segments = list()
+
+		self._segments.append(segment)
 
 	def error_type(self):
 		return self.error_id
@@ -143,47 +248,89 @@ class DeserializationError:
 				
 		"""
 
-		localization_priority = (localization_priority
-			if localization_priority is not None
-			else [default_language])
-
-		for candidate in localization_priority:
-			translation = translations.get(candidate)
-			if translation is not None:
-				break
-
-		else:
-			translation = translations[fallback_language]
+		translation = resolve_translation(localization_priority)
 
 		prefix = translation["prefixes"][self.prefix]
-		prefixText = prefix.format(assignee=self.assignee,
-			index=self.index)
+		prefixText = prefix(_PrefixValues(self))
 
 		message = translation["messages"][self.error_id]
-		messageText = message.format(**self.context)
-		return ": ".join([prefixText, messageText])
+		messageText = message(self.context)
+		return f"{prefixText}: {messageText}"
 
 	def __str__(self):
 		return self.localize()
 
+class _PrefixValues:
+	# exposes the prefix placeholders without assembling
+	# the ones (like the path) the template doesn't use
+
+	__slots__ = ('error',)
+
+	def __init__(self, error):
+		self.error = error
+
+	def __getitem__(self, key):
+		if key in ('assignee', 'index', 'path'):
+			return getattr(self.error, key)
+
+		raise KeyError(key)
+
 #-------------------------------------------------------------------------------
 
-def create_field_error(fieldName, error_id, **context):
-	result = DeserializationError(error_id, **context)
+class ErrorCollector:
+	"""Accumulates deserialization errors up to a given budget."""
+
+	def __init__(self, budget):
+		if type(budget) is not int or budget < 1:
+			msg = f"Error budget needs to be a positive integer, got '{budget}'"
+			raise ValueError(msg)
+
+		self.errors = list()
+		self.budget = budget
+		self.full = False
+
+	def __len__(self):
+		return len(self.errors)
+
+	def add(self, error):
+		self.errors.append(error)
+		self.full = len(self.errors) >= self.budget
+
+	def set_as_array_index(self, mark, arrayIndex):
+		for error in self.errors[mark:]:
+			error.set_as_array_index(arrayIndex)
+
+	def push_path(self, mark, segment):
+		for error in self.errors[mark:]:
+			error.push_path(segment)
+
+#-------------------------------------------------------------------------------
+
+def create_field_error(fieldName, error_id, context=None, **extra):
+	result = DeserializationError(error_id, context, **extra)
+	args = ("FIELD", fieldName) if fieldName != None else ("ROOT",)
+	result.set_assignee(*args)
+	return result
+
+
+def create_rejection_error(fieldName, rejection, typeName):
+	error_id, value = rejection
+	result = DeserializationError(error_id, type=typeName)
+	result._rejected = value
 	args = ("FIELD", fieldName) if fieldName != None else ("ROOT",)
 	result.set_assignee(*args)
 	return result
 
 
-def create_object_error(objectName, error_id, **context):
-	result = DeserializationError(error_id, **context)
+def create_object_error(objectName, error_id, context=None, **extra):
+	result = DeserializationError(error_id, context, **extra)
 	args = ("OBJECT", objectName) if objectName != None else ("ROOT",)
 	result.set_assignee(*args)
 	return result
 
 
-def create_root_error(error_id, **context):
-	result = DeserializationError(error_id, **context)
+def create_root_error(error_id, context=None, **extra):
+	result = DeserializationError(error_id, context, **extra)
 	result.set_assignee("ROOT")
 	return result
 
@@ -205,7 +352,9 @@ __all__ = [
 	"load_translation",
 	"use_default_language",
 	"DeserializationError",
+	"ErrorCollector",
 	"create_field_error",
+	"create_rejection_error",
 	"create_object_error",
 	"create_root_error"
 ]
@@ -0,0 +1,277 @@
+
+import time
+import functools
+from .types import ErrorType
+
+_error_names = { getattr(ErrorType, entry): entry
+	for entry in dir(ErrorType)
+	if not entry.startswith('_')
+}
+
+# calls, cumulative time, bytes, failures by kind
+CALLS, TIME, BYTES, FAILURES = range(4)
+
+#-------------------------------------------------------------------------------
+
+def _new_stat():
+	return [0, 0.0, 0, dict()]
+
+
+def _failure(stats, kind):
+	failures = stats[FAILURES]
+	failures[kind] = failures.get(kind, 0) + 1
+
+
+def _error_name(error):
+	return _error_names.get(error.error_type(), str(error.error_type()))
+
+
+def _export(stats, with_bytes=False):
+	exported = {
+		'calls': stats[CALLS],
+		'time': stats[TIME],
+		'failures': dict(stats[FAILURES])
+	}
+
+	if with_bytes:
+		exported['bytes'] = stats[BYTES]
+
+	return exported
+
+#-------------------------------------------------------------------------------
+
+class BlueprintMetrics:
+	"""Counters gathered by an instrumented :class:`JsonBlueprint`."""
+
+	def __init__(self, callback=None):
+		self.callback = callback
+		self.reset()
+
+	def reset(self):
+		"""Zeroes every counter."""
+
+		self.operations = dict()
+		self.deserialization = {
+			'objects': dict(),
+			'fields': dict(),
+			'types': dict()
+		}
+
+		self.serialization = {
+			'objects': dict(),
+			'types': dict()
+		}
+
+	def snapshot(self):
+		"""Copies the counters into plain dicts.
+
+			Returns:
+				dict: 'operations' maps deserialize, check, serialize and
+				encode to their calls, cumulative time (seconds), length of
+				processed JSON (characters for str) and failures.
+				'deserialization' maps 'objects', 'fields' and 'types' to the
+				statistics of each name, fields being named after the field
+				holding their object ('root' at the top) and their own name,
+				as in 'points.x'. 'serialization' does the same for 'objects'
+				and 'types'.
+				Deserialization failures are counted by ErrorType name,
+				serialization failures by exception name.
+
+		"""
+
+		return {
+			'operations': {name: _export(stats, True)
+				for name, stats in self.operations.items()},
+
+			'deserialization': {category: {name: _export(stats)
+				for name, stats in entries.items()}
+				for category, entries in self.deserialization.items()},
+
+			'serialization': {category: {name: _export(stats)
+				for name, stats in entries.items()}
+				for category, entries in self.serialization.items()}
+		}
+
+	#-----------------------------------------------------------------------------
+
+	def _stats(self, table, name):
+		stats = table.get(name)
+		if stats is None:
+			stats = table[name] = _new_stat()
+
+		return stats
+
+	def _notify(self, operation, elapsed, size, success):
+		if self.callback is not None:
+			self.callback({
+				'operation': operation,
+				'time': elapsed,
+				'bytes': size,
+				'success': success
+			})
+
+#-------------------------------------------------------------------------------
+
+# each instrumented method is shadowed by an instance attribute, so
+# blueprints without metrics run the plain class methods untouched
+
+def _validator(metrics, table, method, naming):
+	@functools.wraps(method)
+	def wrapper(*args, **kwargs):
+		start = time.perf_counter()
+		success, outcome = method(*args, **kwargs)
+		elapsed = time.perf_counter() - start
+
+		stats = metrics._stats(table, naming(*args))
+		stats[CALLS] += 1
+		stats[TIME] += elapsed
+
+		# errors gathered into a collector were counted where raised
+		if not success and outcome is not None:
+			_failure(stats, _error_name(outcome))
+
+		return success, outcome
+
+	return wrapper
+
+
+def _batch_parser(metrics, table, method):
+	@functools.wraps(method)
+	def wrapper(field_type, contents):
+		start = time.perf_counter()
+		parsed = method(field_type, contents)
+		elapsed = time.perf_counter() - start
+
+		stats = metrics._stats(table, field_type)
+		stats[TIME] += elapsed
+		if parsed is not None:
+			stats[CALLS] += len(parsed)
+
+		return parsed
+
+	return wrapper
+
+
+def _serializer(metrics, table, method):
+	@functools.wraps(method)
+	def wrapper(element_type, element_name, content, output):
+		start = time.perf_counter()
+
+		try: return method(element_type, element_name, content, output)
+		except Exception as e:
+			_failure(metrics._stats(table, element_type), type(e).__name__)
+			raise
+
+		finally:
+			stats = metrics._stats(table, element_type)
+			stats[CALLS] += 1
+			stats[TIME] += time.perf_counter() - start
+
+	return wrapper
+
+
+def _deserialize(metrics, operation, method):
+	@functools.wraps(method)
+	def wrapper(contents, *args, **kwargs):
+		start = time.perf_counter()
+		success, outcome = method(contents, *args, **kwargs)
+		elapsed = time.perf_counter() - start
+
+		size = len(contents)
+		stats = metrics._stats(metrics.operations, operation)
+		stats[CALLS] += 1
+		stats[TIME] += elapsed
+		stats[BYTES] += size
+
+		if not success:
+			for error in (outcome if isinstance(outcome, list) else [outcome]):
+				_failure(stats, _error_name(error))
+
+		metrics._notify(operation, elapsed, size, success)
+		return success, outcome
+
+	return wrapper
+
+
+def _serialize(metrics, operation, method):
+	@functools.wraps(method)
+	def wrapper(*args, **kwargs):
+		start = time.perf_counter()
+		stats = metrics._stats(metrics.operations, operation)
+		stats[CALLS] += 1
+
+		try: serialized = method(*args, **kwargs)
+		except Exception as e:
+			elapsed = time.perf_counter() - start
+			stats[TIME] += elapsed
+			_failure(stats, type(e).__name__)
+			metrics._notify(operation, elapsed, 0, False)
+			raise
+
+		elapsed = time.perf_counter() - start
+		stats[TIME] += elapsed
+		stats[BYTES] += len(serialized)
+		metrics._notify(operation, elapsed, len(serialized), True)
+		return serialized
+
+	return wrapper
+
+#-------------------------------------------------------------------------------
+
+_instrumented = (
+	'_validate_object',
+	'_validate_member',
+	'_validate_field',
+	'_validate_enum',
+	'_parse_batch',
+	'_serialize_object',
+	'_serialize_enum',
+	'_serialize_field',
+	'deserialize',
+	'_deserialize_stream',
+	'check',
+	'serialize',
+	'encode'
+)
+
+
+def instrument(blueprint, metrics):
+	deserialization = metrics.deserialization
+	serialization = metrics.serialization
+
+	wrappers = {
+		'_validate_object': _validator(metrics, deserialization['objects'],
+			blueprint._validate_object, lambda name, instance, *rest: instance.name),
+		'_validate_member': _validator(metrics, deserialization['fields'],
+			blueprint._validate_member, lambda object_name, field_name, *rest:
+				f"{object_name or 'root'}.{field_name}"),
+		'_validate_field': _validator(metrics, deserialization['types'],
+			blueprint._validate_field, lambda name, field_type, *rest: field_type),
+		'_validate_enum': _validator(metrics, deserialization['types'],
+			blueprint._validate_enum, lambda name, enum_type, *rest: enum_type),
+		'_parse_batch': _batch_parser(metrics, deserialization['types'],
+			blueprint._parse_batch),
+		'_serialize_object': _serializer(metrics, serialization['objects'],
+			blueprint._serialize_object),
+		'_serialize_enum': _serializer(metrics, serialization['types'],
+			blueprint._serialize_enum),
+		'_serialize_field': _serializer(metrics, serialization['types'],
+			blueprint._serialize_field),
+		'deserialize': _deserialize(metrics, 'deserialize', blueprint.deserialize),
+		# files streamed element by element are counted as deserialize calls
+		'_deserialize_stream': _deserialize(metrics, 'deserialize',
+			blueprint._deserialize_stream),
+		'check': _deserialize(metrics, 'check', blueprint.check),
+		'serialize': _serialize(metrics, 'serialize', blueprint.serialize),
+		'encode': _serialize(metrics, 'encode', blueprint.encode)
+	}
+
+	blueprint.__dict__.update(wrappers)
+	blueprint._bind_serializers()
+
+
+def uninstrument(blueprint):
+	for name in _instrumented:
+		blueprint.__dict__.pop(name, None)
+
+	blueprint._bind_serializers()
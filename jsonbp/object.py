@@ -0,0 +1,136 @@
+
+import collections
+import collections.abc
+
+from .exception import SchemaViolation
+
+_absent = object()
+
+class JsonRecord:
+	"""Base of the slotted classes generated for object declarations.
+
+	Optional fields absent from the JSON are left unset, so reading them
+	raises AttributeError (use getattr with a default when unsure).
+	"""
+
+	__slots__ = ()
+
+	# names of every field, including those of base objects
+	_fields = ()
+
+	def _asdict(self):
+		return {name: getattr(self, name)
+			for name in self._fields
+			if hasattr(self, name)}
+
+	def __eq__(self, other):
+		if type(other) is not type(self):
+			return NotImplemented
+
+		return all(
+			getattr(self, name, _absent) == getattr(other, name, _absent)
+			for name in self._fields)
+
+	def __repr__(self):
+		fields = ", ".join(f"{name}={value!r}"
+			for name, value in self._asdict().items())
+
+		return f"{type(self).__name__}({fields})"
+
+# fields can't take the place of what records rely upon
+_reserved = frozenset(dir(JsonRecord))
+
+
+class JsonObject(collections.abc.Mapping):
+	"""Fields of an object declaration, mapping each name (inherited ones
+	included) to its field declaration.
+
+	An object extending another keeps only the fields it declares, along
+	with its base. Inherited fields come first in its layout, which starts
+	with the very same entries as the layout of the base.
+	"""
+
+	def __init__(self, fields, base=None):
+		self.name = None
+		self.declared = fields
+		self.base = base
+		self._layout = None
+		self._record_type = None
+
+	@property
+	def fields(self):
+		"""Every field declaration by name, inherited ones included."""
+
+		if self.base is None:
+			return self.declared
+
+		return collections.ChainMap(self.declared, self.base.fields)
+
+	@property
+	def layout(self):
+		"""(name, declaration) pairs of every field, inherited ones first."""
+
+		if self._layout is None:
+			inherited = self.base.layout if self.base is not None else ()
+			self._layout = inherited + tuple(self.declared.items())
+
+		return self._layout
+
+	def items(self):
+		return self.layout
+
+	def __getitem__(self, field_name):
+		if field_name in self.declared:
+			return self.declared[field_name]
+
+		if self.base is None:
+			raise KeyError(field_name)
+
+		return self.base[field_name]
+
+	def __contains__(self, field_name):
+		if field_name in self.declared:
+			return True
+
+		return self.base is not None and field_name in self.base
+
+	def __iter__(self):
+		return (field_name for field_name, _ in self.layout)
+
+	def __len__(self):
+		return len(self.layout)
+
+	@property
+	def record_type(self):
+		"""The slotted :class:`JsonRecord` subclass generated for this object.
+
+		Records of an object extending another subclass the records of the
+		base, only adding slots for the fields it declares.
+		"""
+
+		if self._record_type is None:
+			for field_name in self.declared:
+				if (not field_name.isidentifier() or field_name.startswith('__')
+					or field_name in _reserved):
+					raise SchemaViolation(
+						f"Field '{field_name}' of object '{self.name}' "
+						"can't be mapped into a record attribute")
+
+			base_type = self.base.record_type if self.base is not None else JsonRecord
+			self._record_type = type(self.name or 'JsonRecord', (base_type,), {
+				'__slots__': tuple(self.declared),
+				'_fields': tuple(self)
+			})
+
+		return self._record_type
+
+#-------------------------------------------------------------------------------
+
+def create_object(fields, base=None):
+	return JsonObject(fields, base)
+
+def is_object(decl):
+	return isinstance(decl, JsonObject)
+
+def is_record(content):
+	return isinstance(content, JsonRecord)
@@ -1,4 +1,8 @@
 
+import time
+import weakref
+import functools
+import hashlib
 from decimal import Decimal
 from .ply import lex as plyLex
 from .ply import yacc as plyYacc
@@ -11,6 +15,10 @@ from .blueprint import JsonBlueprint
 from .declaration import create_declaration
 from .field import create_field
 from .array import make_array
+from .enumeration import create_enum, is_enum
+from .object import create_object, is_object
+from .report import LoadReport
+from .cache import BlueprintCache, BlueprintRef
 
 reserved = (
 	'root',
@@ -112,6 +120,16 @@ def p_error(p):
 #---------------------------------------------------------------
 
 def typeExists(typeName, excluded=None):
+	started = time.perf_counter()
+	found = findType(typeName, excluded)
+
+	report = currentBlueprint.load_report
+	report.type_checks += 1
+	report.type_checks_time += time.perf_counter() - started
+	return found
+
+
+def findType(typeName, excluded=None):
 	excluded = excluded or set()
 
 	lookups = (
@@ -132,6 +150,7 @@ adhoc_counter = 0
 def getNextAdhoc():
 	global adhoc_counter
 	adhoc_counter += 1
+	currentBlueprint.load_report.adhoc_types += 1
 	return adhoc_counter
 
 #---------------- general structure -----------------------------
@@ -161,12 +180,21 @@ def p_include(p):
 
 	inclusionFile = p[2]
 	inclusionPath = os.path.join(currentPath, inclusionFile)
+	started = time.perf_counter()
+	inclusionKey = fileKey(inclusionPath, None)
+	# files pinned by this load count as cached, even if already evicted
+	cached = (inclusionKey in _loading.pinned
+	  or inclusionKey in cacheFor(inclusionKey))
 	pushEnv()
 
 	try: loadedBlueprint = load_file(inclusionPath)
 	except SchemaViolation as e: raise SchemaViolation(e)
 	finally: popEnv()
 
+	currentBlueprint.load_report.includes.append((inclusionPath,
+	  time.perf_counter() - started,
+	  None if cached else loadedBlueprint.load_report))
+
 	for typeName in loadedBlueprint._collect_types():
 	  if typeExists(typeName, excluded=loadedBlueprint._collect_sources()):
 	    raise SchemaViolation(
@@ -210,19 +238,22 @@ def p_object(p):
 	    msg = f"Object '{baseObject}' is not defined"
 	    raise SchemaViolation(msg)
 
-	  objectFields = p[5]
-	  for fieldName, fieldDeclaration in objectFields.items():
+	  declared = p[5].declared
+	  for fieldName in declared:
 	    if fieldName in baseFields:
 	      raise SchemaViolation(
 	        f"Field '{fieldName}' in object '{objectName}' "
 	        f"is already defined in base object '{baseObject}'"
 	      )
 
-	  objectFields.update(baseFields)
+	  # the base fields are shared, not copied
+	  objectFields = create_object(declared, baseFields)
+	  objectFields.name = objectName
 	  currentBlueprint.objects[objectName] = objectFields
 
 	else:
 	  objectFields = p[3]
+	  objectFields.name = objectName
 	  currentBlueprint.objects[objectName] = objectFields
 
 
@@ -236,7 +267,13 @@ def p_object_specs(p):
 	for decl in decls:
 	  newObject[decl[0]] = decl[1]
 
-	p[0] = newObject
+	p[0] = create_object(newObject)
+
+
+def compileSpecs(typeSpec, specs):
+	compiler = typeSpec.get('compiler')
+	if compiler is not None:
+	  compiler(specs)
 
 
 def createType(newTypeName, declaration):
@@ -273,6 +310,7 @@ def createType(newTypeName, declaration):
 	  base_type = parent_type['__baseType__']
 
 	newType['__baseType__'] = base_type
+	compileSpecs(currentBlueprint.primitive_types[base_type], newType)
 	currentBlueprint.derived_types[newTypeName] = newType
 	return newType
 
@@ -366,14 +404,16 @@ def p_atomic_declaration(p):
 	'''
 
 	declaration = p[1]
-	if isinstance(declaration, dict):
+	if is_object(declaration):
 	  adhoc_object = '_object_type_' + str(getNextAdhoc()) + '_'
+	  declaration.name = adhoc_object
 	  currentBlueprint.objects[adhoc_object] = declaration
 	  kind = FieldType.OBJECT
 	  fieldId = adhoc_object
 
-	elif isinstance(declaration, list):
+	elif is_enum(declaration):
 	  adhoc_enum = '_enum_type_' + str(getNextAdhoc()) + '_'
+	  declaration.name = adhoc_enum
 	  currentBlueprint.enums[adhoc_enum] = declaration
 	  kind = FieldType.ENUM
 	  fieldId = adhoc_enum
@@ -478,7 +518,9 @@ def p_enum(p):
 	  msg = f"Duplicated type '{enum_name}'"
 	  raise SchemaViolation(msg)
 
-	currentBlueprint.enums[enum_name] = p[3]
+	declaration = p[3]
+	declaration.name = enum_name
+	currentBlueprint.enums[enum_name] = declaration
 
 
 def p_enum_declaration(p):
@@ -486,7 +528,7 @@ def p_enum_declaration(p):
 	    enum_declaration : '{' constants '}'
 	'''
 
-	p[0] = p[2]
+	p[0] = create_enum(p[2])
 
 
 def p_constants(p):
@@ -504,12 +546,69 @@ def p_constants(p):
 
 #---------------------------------------------------------------
 
-from threading import Lock
+from threading import Lock, local
 
 _mutex = Lock()
-_loadedFiles = dict()
 _pushedEnvs = list()
 
+# blueprints loaded from files are kept by absolute path, those from
+# strings by a hash of their contents, along with the working directory
+# (includes are relative to it) and in both cases the custom type dirs
+
+_fileCache = BlueprintCache(1024)
+_stringCache = BlueprintCache(128)
+_references = weakref.WeakSet()
+
+def fileKey(filepath, typeDirs):
+	typesKey = tuple(typeDirs) if typeDirs is not None else None
+	return (os.path.abspath(filepath), typesKey)
+
+
+# files are told to have changed by their modification time and size
+
+def fingerprintOf(status):
+	return (status.st_mtime_ns, status.st_size)
+
+
+def stringKey(schema, typeDirs):
+	typesKey = tuple(typeDirs) if typeDirs is not None else None
+	digest = hashlib.sha256(schema.encode('utf-8')).digest()
+	return (digest, os.getcwd(), typesKey)
+
+
+# while reloading, files being replaced are loaded into a cache of the
+# reloading thread, so other threads keep using the previous blueprints
+# until all of them are successfully parsed
+
+_staging = local()
+
+def cacheFor(key):
+	stale = getattr(_staging, 'stale', None)
+	if stale is not None and key[0] in stale:
+	  return _staging.cache
+
+	return _fileCache
+
+
+# every file loaded while loading a blueprint (its whole include tree)
+# is pinned until it's done, so all the includes of a file get the same
+# instance even if the cache evicts it meanwhile, which the detection
+# of duplicated types relies on
+
+_loading = local()
+
+def pinning(load):
+	@functools.wraps(load)
+	def wrapper(*args, **kwargs):
+	  if getattr(_loading, 'pinned', None) is not None:
+	    return load(*args, **kwargs)
+
+	  _loading.pinned = dict()
+	  try: return load(*args, **kwargs)
+	  finally: _loading.pinned = None
+
+	return wrapper
+
 def setupEnv(contentPath, output):
 	global currentBlueprint, currentPath
 	currentPath = contentPath
@@ -531,10 +630,16 @@ def popEnv():
 
 #---------------------------------------------------------------
 
-def _load(contents, contentPath, contentName, typeDirs):
+def _load(contents, contentPath, typeDirs, report):
+	started = time.perf_counter()
 	lexer = plyLex.lex()
+	report.lexer = time.perf_counter() - started
+
+	started = time.perf_counter()
 	parser = plyYacc.yacc()
+	report.parser = time.perf_counter() - started
 
+	started = time.perf_counter()
 	ownPath = os.path.dirname(os.path.realpath(__file__))
 	primitivesPath = os.path.join(ownPath, "types")
 	loaded, notLoaded = load_types(primitivesPath)
@@ -565,17 +670,26 @@ def _load(contents, contentPath, contentName, typeDirs):
 	      msg = f"Unable to load file '{file}' => {problem}"
 	      print_error(msg)
 
+	for typeSpec in primitive_types.values():
+	  compileSpecs(typeSpec, typeSpec['defaults'])
+
+	report.types = time.perf_counter() - started
+
 	try:
 	  _mutex.acquire()
 	  result = JsonBlueprint(primitive_types)
+	  result.load_report = report
 	  setupEnv(contentPath, result)
+
+	  started = time.perf_counter()
 	  parser.parse(contents)
 
-	  if None != contentName:
-	    contentFullpath = os.path.join(contentPath, contentName)
-	    abspath = os.path.abspath(contentFullpath)
-	    _loadedFiles[abspath] = result
+	  report.parse = time.perf_counter() - started - sum(elapsed
+	    for _, elapsed, _ in report.includes)
 
+	  report.types_created = len(result.derived_types)
+	  report.enums_created = len(result.enums)
+	  report.objects_created = len(result.objects)
 	  return result
 
 	finally:
@@ -585,18 +699,26 @@ def _load(contents, contentPath, contentName, typeDirs):
 
 import os
 
+@pinning
 def load_file(filepath, **kwargs):
 
 	'''Loads a :class:`JsonBlueprint` from a file.
 
 	On success, the  returned instance is associated with the
-	absolute path of the argument file, and subsequent calls of this
-	function to the same file will be presented with the same instance,
-	unless :func:`invalidate_cache` is invoked.
+	absolute path of the argument file (and the custom types), and
+	subsequent calls of this function to the same file will be presented
+	with the same instance, unless :func:`invalidate_cache` is invoked or
+	it's evicted, being the least recently used when more than
+	1024 files are cached (see :func:`set_cache_size`).
+
+	The time spent in each phase of loading is kept in the blueprint's
+	`load_report` attribute, a :class:`jsonbp.LoadReport`.
 
 	Args:
 	  filepath (str): schema file to load.
 	  **custom_types (str[]): list of directories to scan for primitive types.
+	  **report_hook (callable): called with the load report whenever the file
+	    is effectively parsed.
 
 	Returns:
 	  JsonBlueprint: the generated blueprint
@@ -607,31 +729,61 @@ def load_file(filepath, **kwargs):
 
 	'''
 
-	abspath = os.path.abspath(filepath)
-	if abspath in _loadedFiles:
-	  return _loadedFiles[abspath]
+	typeDirs = kwargs.get('custom_types')
+	key = fileKey(filepath, typeDirs)
+	pinned = _loading.pinned
+
+	found = pinned.get(key)
+	if found is not None:
+	  return found
+
+	cache = cacheFor(key)
+	cached = cache.get(key)
+	if cached is not None:
+	  pinned[key] = cached
+	  return cached
+
+	started = time.perf_counter()
+	report = LoadReport(filepath)
 
 	try:
 	  with open(filepath, "r") as fd:
+	    fingerprint = fingerprintOf(os.fstat(fd.fileno()))
 	    contents = fd.read()
 
 	except FileNotFoundError:
 	  msg = f'Unable to open file "{filepath}"'
 	  raise SchemaViolation(msg)
 
-	return _load(contents,
+	report.read = time.perf_counter() - started
+	result = _load(contents,
 	  os.path.dirname(filepath),
-	  os.path.basename(filepath),
-	  kwargs.get('custom_types'))
+	  typeDirs, report)
 
+	result.path = key[0]
+	result.fingerprint = fingerprint
+	pinned[key] = result
+	cache.put(key, result)
+	return _finish_report(result, started, kwargs)
 
+
+@pinning
 def load_string(schema, **kwargs):
 
 	'''Loads a :class:`JsonBlueprint` from the contents of a string.
 
+	Like :func:`load_file`, the result is cached, and loading the same
+	contents again (from the same working directory and with the same
+	custom types) skips parsing, as long as it's among the 128 most
+	recently used strings (see :func:`set_cache_size`). Each call still
+	returns its own instance, sharing the declarations with the others,
+	so settings such as :meth:`JsonBlueprint.enable_metrics` made by one
+	caller don't affect the others.
+
 	Args:
 	  schema (str): schema definition.
 	  **custom_types (str[]): list of directories to scan for primitive types.
+	  **report_hook (callable): called with the load report (see :func:`load_file`).
 
 	Returns:
 	  JsonBlueprint: the generated blueprint
@@ -642,26 +794,181 @@ def load_string(schema, **kwargs):
 
 	'''
 
-	return _load(schema, '.', None,
-	  kwargs.get('custom_types'))
+	typeDirs = kwargs.get('custom_types')
+	key = stringKey(schema, typeDirs)
+
+	cached = _stringCache.get(key)
+	if cached is not None:
+	  return cached._derive()
+
+	started = time.perf_counter()
+	result = _load(schema, '.',
+	  typeDirs, LoadReport())
+
+	_stringCache.put(key, result)
+	return _finish_report(result, started, kwargs)._derive()
+
+
+def _finish_report(result, started, kwargs):
+	report = result.load_report
+	report.total = time.perf_counter() - started
+
+	hook = kwargs.get('report_hook')
+	if hook is not None:
+	  hook(report)
+
+	return result
 
 #-------------------------------------------------------------------------------
 
-def invalidate_cache():
-	'''Clears associations between files and existing JsonBlueprint instances.
+def invalidate_cache(path=None):
+	'''Clears associations between files (or strings) and existing JsonBlueprint instances.
 
 	This forces new :func:`load_file` invocations to effectively parse the files instead
 	of returning a cached result (Useful when your schema file changed and needs
 	to be refreshed).
 
-	'''
+	Args:
+	  path (str): if given, only the blueprint of this file is forgotten, along with
+	    those which include it, directly or not. Otherwise, everything is.
 
-	global _loadedFiles
+	'''
 
 	try:
 	  _mutex.acquire()
-	  _loadedFiles = dict()
+
+	  if path is None:
+	    _fileCache.clear()
+	    _stringCache.clear()
+
+	    for reference in list(_references):
+	      reference._invalidate()
+
+	    return
+
+	  abspath = os.path.abspath(path)
+	  _fileCache.evict(lambda key, blueprint:
+	    key[0] == abspath or blueprint._depends_on(abspath))
+
+	  _stringCache.evict(lambda key, blueprint:
+	    blueprint._depends_on(abspath))
+
+	  for reference in list(_references):
+	    current = reference._blueprint
+	    if reference.key[0] == abspath or (current is not None and
+	      current._depends_on(abspath)):
+	      reference._invalidate()
 
 	finally:
 	  _mutex.release()
 
+
+def set_cache_size(files=None, strings=None):
+	'''Changes how many blueprints are cached.
+
+	When full, loading another blueprint evicts the least recently used one.
+	Shrinking a cache evicts its excess right away.
+
+	Args:
+	  files (int): blueprints loaded by :func:`load_file` (1024 by default).
+	  strings (int): blueprints loaded by :func:`load_string` (128 by default),
+	    0 disables caching them.
+
+	Raises:
+	  ValueError: when a size is not a non negative integer.
+
+	'''
+
+	if files is not None: _fileCache.resize(files)
+	if strings is not None: _stringCache.resize(strings)
+
+
+def cache_statistics():
+	'''Reports how the blueprint caches are doing.
+
+	Returns:
+	  dict: for both 'files' and 'strings', a dict with the current 'size',
+	  'maxsize', and the counts of 'hits', 'misses' and 'evictions'.
+
+	'''
+
+	return {
+	  'files': _fileCache.statistics(),
+	  'strings': _stringCache.statistics()
+	}
+
+
+def reloadFiles(paths):
+	'''Parses again the given files and the cached blueprints including them,
+	replacing the cached blueprints at once only if all of them succeed.
+
+	Returns the absolute paths of the reloaded files. Blueprints loaded from
+	strings which include any of the files are evicted instead.
+	'''
+
+	abspaths = {os.path.abspath(path) for path in paths}
+	affected = lambda key, blueprint: (key[0] in abspaths or
+	  any(blueprint._depends_on(path) for path in abspaths))
+
+	stale = [key for key, blueprint in _fileCache.items()
+	  if affected(key, blueprint)]
+
+	_staging.stale = abspaths | {key[0] for key in stale}
+	_staging.cache = BlueprintCache(len(stale) + len(abspaths))
+
+	try:
+	  for key in stale:
+	    typeDirs = list(key[1]) if key[1] is not None else None
+	    load_file(key[0], custom_types=typeDirs)
+
+	  reloaded = {key: _staging.cache.get(key) for key in stale}
+
+	finally:
+	  _staging.stale = None
+	  _staging.cache = None
+
+	_fileCache.update(reloaded)
+	_stringCache.evict(affected)
+
+	# handles whose blueprint was meanwhile evicted load it again
+
+	for reference in list(_references):
+	  current = reference._blueprint
+	  if reference.key in reloaded:
+	    reference._replace(reloaded[reference.key])
+
+	  elif current is not None and affected(reference.key, current):
+	    reference._invalidate()
+
+	return [key[0] for key in stale]
+
+
+def blueprint_ref(filepath, **kwargs):
+	'''Loads a blueprint like :func:`load_file`, returning a handle to it.
+
+	The handle's get() method returns the blueprint, at the cost of an attribute
+	read, sparing the path resolution and cache lookup of :func:`load_file`. It
+	keeps returning the same blueprint until the file (or any file it includes) is
+	invalidated through :func:`invalidate_cache`, when it's loaded again on the next
+	call, or reloaded by :func:`watch_blueprints`, when the new one is returned.
+
+	Args:
+	  filepath (str): schema file to load.
+	  **custom_types (str[]): list of directories to scan for primitive types.
+
+	Returns:
+	  BlueprintRef: the handle, whose get() returns a JsonBlueprint.
+
+	Raises:
+	  SchemaViolation: when the schema is malformed or there are inconsistencies
+	    in its relations
+
+	'''
+
+	key = fileKey(filepath, kwargs.get('custom_types'))
+	reference = BlueprintRef(key,
+	  lambda: load_file(key[0], **kwargs))
+
+	reference.get()
+	_references.add(reference)
+	return reference
@@ -0,0 +1,74 @@
+
+class LoadReport:
+	"""Time spent in each phase of loading a blueprint, in seconds.
+
+	Attributes:
+		path (str): file loaded, None for strings.
+		read (float): reading the file.
+		lexer (float): building the PLY lexer.
+		parser (float): building the PLY parser tables.
+		types (float): executing the primitive type modules.
+		parse (float): parsing, without the time spent in includes.
+		type_checks (int): lookups of already declared names.
+		type_checks_time (float): part of 'parse' taken by those lookups.
+		includes (list): one (path, seconds, report) entry per include,
+			report being None when the file was already cached.
+		types_created (int): types declared, including adhoc ones.
+		enums_created (int): enums declared, including adhoc ones.
+		objects_created (int): objects declared, including adhoc ones.
+		adhoc_types (int): types, enums and objects declared inline.
+		total (float): the whole load.
+	"""
+
+	def __init__(self, path=None):
+		self.path = path
+		self.read = 0.0
+		self.lexer = 0.0
+		self.parser = 0.0
+		self.types = 0.0
+		self.parse = 0.0
+		self.type_checks = 0
+		self.type_checks_time = 0.0
+		self.includes = list()
+		self.types_created = 0
+		self.enums_created = 0
+		self.objects_created = 0
+		self.adhoc_types = 0
+		self.total = 0.0
+
+	def as_dict(self):
+		"""Converts the report, and those of its includes, into plain dicts."""
+
+		result = dict(vars(self))
+		result['includes'] = [{
+			'path': path,
+			'time': elapsed,
+			'report': report.as_dict() if report is not None else None
+		} for path, elapsed, report in self.includes]
+
+		return result
+
+	def __str__(self):
+		return '\n'.join(self._lines(0))
+
+	def _lines(self, depth):
+		indent = '  ' * depth
+		name = self.path if self.path is not None else '<string>'
+
+		lines = [
+			f"{indent}{name}: {self.total * 1000:.3f} ms",
+			f"{indent}  read {self.read * 1000:.3f} ms, lexer {self.lexer * 1000:.3f} ms, "
+			f"parser {self.parser * 1000:.3f} ms, types {self.types * 1000:.3f} ms",
+			f"{indent}  parse {self.parse * 1000:.3f} ms ({self.type_checks} type checks "
+			f"taking {self.type_checks_time * 1000:.3f} ms)",
+			f"{indent}  created {self.types_created} types, {self.enums_created} enums, "
+			f"{self.objects_created} objects ({self.adhoc_types} adhoc)"
+		]
+
+		for path, elapsed, report in self.includes:
+			if report is None:
+				lines.append(f"{indent}  {path}: {elapsed * 1000:.3f} ms (cached)")
+			else:
+				lines.extend(report._lines(depth + 1))
+
+		return lines
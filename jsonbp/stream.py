@@ -0,0 +1,158 @@
+
+import json
+import codecs
+
+_chunk_size = 1 << 20
+_whitespace = ' \t\n\r'
+
+# how close to the window's end a value may stop or fail and still have
+# been cut short: a number missing its exponent (as in '1.5e-') or a
+# constant missing its last letters (as in '-Infinit')
+_number_tail = len('e-')
+_partial_token = len('-Infinity')
+
+class ArrayStream:
+	"""Decodes the elements of a top level JSON array one at a time.
+
+	Only a window of the text is kept decoded, so elements can be
+	validated straight from a memory mapped file without loading all
+	of its contents. The window grows whenever an element doesn't fit,
+	but problems found away from its end are reported right away.
+	"""
+
+	def __init__(self, buffer, decoder, chunk_size=_chunk_size):
+		self.buffer = buffer
+		self.decoder = decoder
+		self.chunk_size = chunk_size
+		self.text = ''
+		self.pos = 0
+		self.offset = 0
+		self.line = 1
+		self.column = 1
+		self.exhausted = False
+
+		view = memoryview(buffer)
+		self.view = view
+		self.unicode = codecs.getincrementaldecoder('utf-8')()
+		self.consumed = 3 if bytes(view[:3]) == codecs.BOM_UTF8 else 0
+
+	@staticmethod
+	def supports(buffer):
+		"""Whether the contents can be streamed, i.e. are UTF-8 and an array."""
+
+		view = memoryview(buffer)
+		head = bytes(view[:4])
+		if json.detect_encoding(head) not in ('utf-8', 'utf-8-sig'):
+			return False
+
+		start = 3 if head.startswith(codecs.BOM_UTF8) else 0
+		for byte in view[start:start + 4096]:
+			if byte in b' \t\n\r': continue
+			return byte == ord('[')
+
+		return False
+
+	#---------------------------------------------------------------------------
+
+	def _read(self, size):
+		if self.exhausted:
+			return False
+
+		chunk = self.view[self.consumed:self.consumed + size]
+		self.consumed += len(chunk)
+		final = self.consumed >= len(self.view)
+		decoded = self.unicode.decode(chunk, final)
+		self.exhausted = final
+
+		self._discard()
+		self.text += decoded
+		return True
+
+	def _discard(self):
+		# drops what was already consumed from the window,
+		# keeping track of lines for error reporting
+
+		consumed = self.text[:self.pos]
+		newlines = consumed.count('\n')
+		if newlines > 0:
+			self.line += newlines
+			self.column = len(consumed) - consumed.rfind('\n')
+
+		else:
+			self.column += len(consumed)
+
+		self.text = self.text[self.pos:]
+		self.pos = 0
+
+	def _error(self, msg, pos):
+		error = json.JSONDecodeError(msg, self.text, pos)
+		if error.lineno == 1: error.colno += self.column - 1
+		error.lineno += self.line - 1
+		return error
+
+	def _skip_whitespace(self):
+		while True:
+			text = self.text
+			pos = self.pos
+			while pos < len(text) and text[pos] in _whitespace:
+				pos += 1
+
+			self.pos = pos
+			if pos < len(text) or not self._read(self.chunk_size):
+				return pos < len(text)
+
+	def _next_char(self, expected):
+		if not self._skip_whitespace():
+			raise self._error(f"Expecting {expected}", self.pos)
+
+		return self.text[self.pos]
+
+	def _decode_value(self):
+		size = self.chunk_size
+		while True:
+			try:
+				value, end = self.decoder.raw_decode(self.text, self.pos)
+
+				# a value stopping near the window's end might have been
+				# cut short (e.g. a number), so it needs a lookahead
+
+				if len(self.text) - end > _number_tail or self.exhausted:
+					self.pos = end
+					return value
+
+			except json.JSONDecodeError as e:
+				truncated = (e.msg.startswith('Unterminated string')
+					or len(self.text) - e.pos <= _partial_token)
+
+				if self.exhausted or not truncated:
+					raise self._error(e.msg, e.pos)
+
+			self._read(size)
+			size *= 2
+
+	#---------------------------------------------------------------------------
+
+	def close(self):
+		self.view.release()
+
+	def __iter__(self):
+		if self._next_char("'['") != '[':
+			raise self._error("Expecting '['", self.pos)
+
+		self.pos += 1
+		if self._next_char("value") == ']':
+			self.pos += 1
+
+		else:
+			while True:
+				self._skip_whitespace()
+				yield self._decode_value()
+
+				separator = self._next_char("',' delimiter")
+				self.pos += 1
+				if separator == ']': break
+				if separator != ',':
+					raise self._error("Expecting ',' delimiter", self.pos - 1)
+
+		if self._skip_whitespace():
+			raise self._error("Extra data", self.pos)
@@ -19,6 +19,17 @@ class FieldType:
 	OBJECT = 2
 
 
+class EnumOutput:
+	LITERAL = 0   # the JSON string itself
+	MEMBER  = 1   # member of a generated enum.Enum class
+	ORDINAL = 2   # position of the literal in the declaration
+
+
+class ObjectOutput:
+	DICT   = 0   # plain dict per object
+	RECORD = 1   # instance of a slotted class generated per object
+
+
 class unquoted_str(str):
 	pass
 
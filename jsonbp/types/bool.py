@@ -10,16 +10,17 @@ def _format(value, specs):
 	return "true" if value else "false"
 
 
+def _prepare(value, specs):
+	return True if value else False
+
+
 def _parse(value, specs):
 	if isinstance(value, jsonbp.unquoted_str):
 		if value in ('true', 'false'):
 			return True, value == "true"
 
 	if not specs['coerce']:
-		return False, {
-			"error": jsonbp.ErrorType.VALUE_PARSING,
-			"context": {}
-		}
+		return False, (jsonbp.ErrorType.VALUE_PARSING, value)
 
 	# coercion attempts
 	# check if it's 'null' or empty string
@@ -48,6 +49,7 @@ type_specs = {
 	'name': 'Bool',
 	'parser': _parse,
 	'formatter': _format,
+	'preparer': _prepare,
 	'defaults': _defaults
 }
 
@@ -1,26 +1,58 @@
 
 from datetime import date
+import memo
 
 _defaults = {
-	'format': "%Y-%m-%d"
+	'format': "%Y-%m-%d",
+	'cache': True
 }
 
 
-def _format(value, specs):
-	result = value.strftime(specs['format'])
+def _render(value, strFormat):
+	result = value.strftime(strFormat)
 	return f'"{result}"'
 
 
+# datetimes are dates too, and those equal to each other may still
+# differ in their timezone, so both type and tzinfo are in the key
+
+@memo.memoize
+def _render_memo(value, kind, tzinfoId, strFormat):
+	return _render(value, strFormat)
+
+
+def _format(value, specs):
+	strFormat = specs['format']
+	if not specs['cache']:
+		return _render(value, strFormat)
+
+	tzinfo = getattr(value, 'tzinfo', None)
+	try: return _render_memo(value, type(value), id(tzinfo), strFormat)
+	except TypeError:
+		return _render(value, strFormat)
+
+
+_read_memo = memo.memoize(date.fromisoformat)
+
+
 def _parse(value, specs):
 	str_value = str(value)
-	parsed_date = date.fromisoformat(str_value)
+	read = _read_memo if specs['cache'] else date.fromisoformat
+	parsed_date = read(str_value)
 	return True, parsed_date
 
 
+def _statistics():
+	return {
+		'parse': memo.statistics(_read_memo),
+		'format': memo.statistics(_render_memo)
+	}
+
+
 type_specs = {
 	'name': 'Date',
 	'parser': _parse,
 	'formatter': _format,
-	'defaults': _defaults
+	'defaults': _defaults,
+	'statistics': _statistics
 }
-
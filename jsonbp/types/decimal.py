@@ -6,6 +6,7 @@ import decimal
 
 import jsonbp
 import limits
+import memo
 
 _defaults = {
 	'precision': 2,
@@ -22,45 +23,73 @@ _defaults = {
 rounding_context = decimal.Context(rounding=decimal.ROUND_DOWN)
 special_chars = r'.^$*+?|'
 
-def _format(value, specs):
-	radix = specs['radix']
-	separator = specs['separator']
+def _indian(integer, separator):
+	digits = integer.lstrip('-')
+	if len(digits) <= 3 or not digits.isdigit():
+		return integer
+
+	# the last three digits, then pairs of them
+	sign = integer[:len(integer) - len(digits)]
+	head, tail = digits[:-3], digits[-3:]
+	cut = len(head) % 2
+
+	groups = [head[start:start + 2] for start in range(cut, len(head), 2)]
+	if cut > 0:
+		groups.insert(0, head[:cut])
+
+	groups.append(tail)
+	return sign + separator.join(groups)
+
+
+@memo.memoize
+def _compile(radix, separator, indianFormat, prefix, suffix):
+	"""Builds the function writing values for a combination of specs."""
 
-	raw_string = str(value)
-	parts = raw_string.split('.')
-	integer_part = parts[0]
+	quoted = '' != prefix or '' != suffix or '.' != radix or '' != separator
+	opening = f'"{prefix}' if quoted else ''
+	closing = f'{suffix}"' if quoted else ''
 
-	if '' != separator and len(integer_part) > 3:
-		hundredths = integer_part[-3:]
-		thousandths = integer_part[:-3]
+	# thousands are grouped while formatting, then the comma is replaced
+	pattern = ',f' if '' != separator and not indianFormat else 'f'
+	localized = '' != separator or '.' != radix
 
-		groupSize = 3 if not specs['indianFormat'] else 2
-		leadingSize = len(thousandths) % groupSize
-		leading = thousandths[:leadingSize]
+	def formatter(value):
+		if type(value) is not Decimal:
+			try: value = Decimal(str(value))
+			except decimal.InvalidOperation:
+				msg = f"Value '{value}' is not a valid Decimal"
+				raise jsonbp.SerializationException(msg)
 
-		remaining = thousandths[leadingSize:]
-		separated = re.findall(".{" + str(groupSize) + "}", remaining)
-		thousandths = (leading, *separated) if leadingSize > 0 else separated
-		integer_part = separator.join((*thousandths, hundredths))
+		text = format(value, pattern)
+		if localized:
+			integer, _, fraction = text.partition('.')
+			if indianFormat:
+				integer = _indian(integer, separator)
+			elif ',' != separator:
+				integer = integer.replace(',', separator)
 
-	decimalPart = parts[1]
-	content = (radix.join([integer_part, decimalPart])
-		if len(parts) > 1
-		else integer_part)
+			text = f'{integer}{radix}{fraction}' if '' != fraction else integer
+
+		return f'{opening}{text}{closing}'
+
+	return formatter
+
+
+def _compileSpecs(specs):
+	specs['__formatter__'] = _compile(specs['radix'], specs['separator'],
+		specs['indianFormat'], specs['prefix'], specs['suffix'])
+
+
+def _format(value, specs):
+	return specs['__formatter__'](value)
 
-	parts = ([ part
-		for part in [ specs['prefix'], content, specs['suffix'] ]
-		if len(part) > 0
-	])
 
-	needsQuotes = (
-		len(parts) > 1 or
-		'.' != radix or
-		'' != separator)
+def _prepare(value, specs):
+	text = _format(value, specs)
+	if text[:1] == '"':
+		return jsonbp.backend.fragment_value(text)
 
-	formattedParts = "".join(parts)
-	return (f'"{formattedParts}"' if needsQuotes
-		else formattedParts)
+	return jsonbp.backend.number_value(text)
 
 
 def _parse(value, specs):
@@ -79,10 +108,7 @@ def _parse(value, specs):
 
 	decimalPattern = f'^[+-]?\\d+({separator}\\d+)*({radix}\\d+)?$'
 	if None == re.match(decimalPattern, sanedValue):
-		return False, {
-			"error": jsonbp.ErrorType.VALUE_PARSING,
-			"context": {}
-		}
+		return False, (jsonbp.ErrorType.VALUE_PARSING, value)
 
 	sanedStrValue = (sanedValue
 		.replace(specs['separator'], '')
@@ -94,10 +120,7 @@ def _parse(value, specs):
 		context=rounding_context)
 
 	if specs['min'] > rawValue or rawValue > specs['max']:
-		return False, {
-			"error": jsonbp.ErrorType.OUTSIDE_RANGE,
-			"context": { "value": rawValue }
-		}
+		return False, (jsonbp.ErrorType.OUTSIDE_RANGE, value)
 
 	return True, rawValue
 
@@ -106,6 +129,8 @@ type_specs = {
 	'name': 'Decimal',
 	'parser': _parse,
 	'formatter': _format,
-	'defaults': _defaults
+	'preparer': _prepare,
+	'defaults': _defaults,
+	'compiler': _compileSpecs
 }
 
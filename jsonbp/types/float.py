@@ -5,6 +5,7 @@ import jsonbp
 nan = float('nan')
 minus_infinity = float('-inf')
 plus_infinity = float('+inf')
+_parseable = {str, jsonbp.unquoted_str}
 
 # for format options, see:
 # https://cplusplus.com/reference/cstdio/printf/
@@ -28,6 +29,12 @@ def _format(value, specs):
 	return strFormat % value
 
 
+def _prepare(value, specs):
+	# the formatted text is kept, the encoders can't write NaN
+	# or Infinity, nor honour the format
+	return jsonbp.backend.number_value(_format(value, specs))
+
+
 def _parse(value, specs):
 	sanedValue = value.replace('Infinity', 'inf')
 	rawValue = float(sanedValue)
@@ -36,10 +43,7 @@ def _parse(value, specs):
 		if specs['allowNaN']:
 			return True, rawValue
 
-		return False, {
-			"error": jsonbp.ErrorType.OUTSIDE_RANGE,
-			"context": {"value": rawValue}
-		}
+		return False, (jsonbp.ErrorType.OUTSIDE_RANGE, value)
 
 	checks = [
 		lambda : not rawValue < specs['atLeast'],
@@ -58,18 +62,55 @@ def _parse(value, specs):
 
 	for check in checks:
 		if not check():
-			return False, {
-				"error": jsonbp.ErrorType.OUTSIDE_RANGE,
-				"context": {"value": rawValue}
-			}
+			return False, (jsonbp.ErrorType.OUTSIDE_RANGE, value)
 
 	return True, rawValue
 
 
+def _parse_batch(values, specs):
+	# only strings are parsed element-wise, booleans
+	# inside arrays must still be refused
+
+	if not set(map(type, values)) <= _parseable:
+		return None
+
+	try: rawValues = list(map(float, values))
+	except ValueError:
+		return None
+
+	if len(rawValues) == 0:
+		return rawValues
+
+	# a NaN anywhere turns the sum into NaN, leave
+	# those arrays to the element-wise parser
+
+	total = sum(rawValues)
+	if total != total:
+		return None
+
+	lowest = min(rawValues)
+	highest = max(rawValues)
+
+	if lowest < specs['atLeast'] or highest > specs['atMost']:
+		return None
+
+	floor = specs['greaterThan']
+	if not math.isnan(floor) and not lowest > floor:
+		return None
+
+	ceiling = specs['lessThan']
+	if not math.isnan(ceiling) and not highest < ceiling:
+		return None
+
+	return rawValues
+
+
 type_specs = {
 	'name': 'Float',
 	'parser': _parse,
+	'batch_parser': _parse_batch,
 	'formatter': _format,
+	'preparer': _prepare,
 	'defaults': _defaults
 }
 
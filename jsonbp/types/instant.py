@@ -1,40 +1,235 @@
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import memo
 
 _defaults = {
 	'iso': True,
 	'isoResolution': 'milliseconds',
-	'format': "%Y-%m-%dT%H:%M:%S%z"
+	'format': "%Y-%m-%dT%H:%M:%S%z",
+	'cache': True
 }
 
 # allowed_resolutions:
 # https://docs.python.org/3/library/datetime.html#datetime.datetime.isoformat
 
-def _format(value, specs):
-	if specs['iso']:
-		resolution = specs['isoResolution']
+def _render(value, iso, resolution, strFormat):
+	if iso:
 		result = value.isoformat(timespec=resolution)
 		return f'"{result}"'
 
-	result = value.strftime(specs['format'])
+	result = value.strftime(strFormat)
 	return f'"{result}"'
 
 
+# datetimes equal to each other may still differ in their timezone
+# or fold, which change how they're written, so both are part of the
+# key (the tzinfo is kept alive by the value, its id can't be reused)
+
+@memo.memoize
+def _render_memo(value, kind, tzinfoId, fold, iso, resolution, strFormat):
+	return _render(value, iso, resolution, strFormat)
+
+
+def _format(value, specs):
+	iso, resolution, strFormat = specs['iso'], specs['isoResolution'], specs['format']
+	if not specs['cache']:
+		return _render(value, iso, resolution, strFormat)
+
+	try: return _render_memo(value, type(value), id(value.tzinfo), value.fold,
+		iso, resolution, strFormat)
+
+	except (AttributeError, TypeError):
+		return _render(value, iso, resolution, strFormat)
+
+
+# fixed width directives the compiled readers slice out of the value,
+# with the datetime argument each one fills in
+_slicedFields = {
+	'Y': (4, 0),
+	'y': (2, 0),
+	'm': (2, 1),
+	'd': (2, 2),
+	'H': (2, 3),
+	'M': (2, 4),
+	'S': (2, 5)
+}
+
+# what strptime assumes for missing fields
+_missingFields = (1900, 1, 1, 0, 0, 0, 0)
+
+
+@memo.memoize
+def _offset(text):
+	if text == 'Z':
+		return timezone.utc
+
+	if len(text) == 6 and text[3] == ':':
+		text = text[:3] + text[4:]
+
+	sign, digits = text[:1], text[1:]
+	if len(text) != 5 or sign not in ('+', '-') or not (digits.isascii() and digits.isdecimal()):
+		return None
+
+	hours, minutes = int(digits[:2]), int(digits[2:])
+	if hours > 23 or minutes > 59:
+		return None
+
+	delta = timedelta(hours=hours, minutes=minutes)
+	return timezone(-delta if sign == '-' else delta)
+
+
+@memo.memoize
+def _compile(strFormat):
+	"""Builds a reader for formats strptime would match at fixed positions.
+
+		Only the directives in _slicedFields are handled, possibly followed
+		by %f and %z at the very end. The reader returns None whenever the
+		value isn't laid out exactly as expected, leaving it to strptime.
+
+		Returns:
+			callable: the reader, or None if the format isn't supported.
+
+	"""
+
+	slices = list()
+	literals = list()
+	fraction = offset = False
+	width, index = 0, 0
+
+	while index < len(strFormat):
+		char = strFormat[index]
+		if char != '%' or strFormat[index + 1:index + 2] == '%':
+			if fraction or offset:
+				return None
+
+			# consecutive literals are compared at once
+			position, text = literals[-1] if len(literals) > 0 else (None, '')
+			if position is not None and position + len(text) == width:
+				literals[-1] = (position, text + char)
+			else:
+				literals.append((width, char))
+
+			width += 1
+			index += 2 if char == '%' else 1
+			continue
+
+		directive = strFormat[index + 1:index + 2]
+		index += 2
+
+		if directive == 'f' and not (fraction or offset): fraction = True
+		elif directive == 'z' and not offset: offset = True
+		elif directive in _slicedFields and not (fraction or offset):
+			size, slot = _slicedFields[directive]
+			if any(slot == used for _, _, used, _ in slices):
+				return None
+
+			slices.append((width, width + size, slot, directive == 'y'))
+			width += size
+
+		else:
+			return None
+
+	if len(slices) == 0:
+		return None
+
+	spans = [(start, end) for start, end, _, _ in slices]
+	slots = [(slot, shortYear) for _, _, slot, shortYear in slices]
+
+	# year, month, day... in this order take the shortest path
+	inOrder = slots == [(slot, False) for slot in range(len(slots))]
+	variable = fraction or offset
+
+	def reader(value):
+		if len(value) < width or (len(value) > width and not variable):
+			return None
+
+		for position, text in literals:
+			if not value.startswith(text, position):
+				return None
+
+		# strptime only takes ASCII digits for most fields
+		numbers = [value[start:end] for start, end in spans]
+		digits = ''.join(numbers)
+		if not (digits.isascii() and digits.isdecimal()):
+			return None
+
+		if inOrder:
+			arguments = [int(number) for number in numbers]
+			arguments.extend(_missingFields[len(arguments):])
+
+		else:
+			arguments = list(_missingFields)
+			for (slot, shortYear), number in zip(slots, numbers):
+				number = int(number)
+				if shortYear:
+					number += 2000 if number <= 68 else 1900
+
+				arguments[slot] = number
+
+		tzinfo = None
+		if variable:
+			rest = value[width:]
+			if fraction:
+				digits = len(rest) - len(rest.lstrip('0123456789'))
+				if digits == 0 or digits > 6:
+					return None
+
+				arguments[6] = int(rest[:digits].ljust(6, '0'))
+				rest = rest[digits:]
+
+			if offset:
+				tzinfo = _offset(rest)
+				if tzinfo is None:
+					return None
+
+			elif len(rest) > 0:
+				return None
+
+		try: return datetime(*arguments, tzinfo=tzinfo)
+		except ValueError:
+			return None
+
+	return reader
+
+
+def _compileSpecs(specs):
+	specs['__reader__'] = None if specs['iso'] else _compile(specs['format'])
+
+
+def _read(value, iso, strFormat, reader=None):
+	if iso:
+		return datetime.fromisoformat(value)
+
+	if reader is not None:
+		parsed = reader(value)
+		if parsed is not None:
+			return parsed
+
+	return datetime.strptime(value, strFormat)
+
+_read_memo = memo.memoize(_read)
+
+
 def _parse(value, specs):
 	sanedValue = str(value)
+	read = _read_memo if specs['cache'] else _read
+	parsed_date = read(sanedValue, specs['iso'], specs['format'],
+		specs.get('__reader__'))
+	return True, parsed_date
 
-	parsed_date = (
-		datetime.fromisoformat(sanedValue) if specs['iso']
-		else datetime.strptime(sanedValue, specs['format'])
-	)
 
-	return True, parsed_date
+def _statistics():
+	return {
+		'parse': memo.statistics(_read_memo),
+		'format': memo.statistics(_render_memo)
+	}
 
 
 type_specs = {
 	'name': 'Instant',
 	'parser': _parse,
 	'formatter': _format,
-	'defaults': _defaults
+	'defaults': _defaults,
+	'compiler': _compileSpecs,
+	'statistics': _statistics
 }
-
@@ -12,21 +12,39 @@ def _format(value, specs):
 	return str(value)
 
 
+def _prepare(value, specs):
+	if type(value) is int:
+		return value
+
+	return jsonbp.backend.raw_json(_format(value, specs))
+
+
 def _parse(value, specs):
 	intValue = int(value)
 	if not specs['min'] <= intValue <= specs['max']:
-		return False, {
-			"error": jsonbp.ErrorType.OUTSIDE_RANGE,
-			"context": {"value": intValue}
-		}
+		return False, (jsonbp.ErrorType.OUTSIDE_RANGE, value)
 
 	return True, intValue
 
 
+def _parse_batch(values, specs):
+	try: intValues = list(map(int, values))
+	except (TypeError, ValueError):
+		return None
+
+	if len(intValues) > 0:
+		if specs['min'] > min(intValues) or max(intValues) > specs['max']:
+			return None
+
+	return intValues
+
+
 type_specs = {
 	'name': 'Integer',
 	'parser': _parse,
+	'batch_parser': _parse_batch,
 	'formatter': _format,
+	'preparer': _prepare,
 	'defaults': _defaults
 }
 
@@ -0,0 +1,36 @@
+import functools
+
+# values kept by each memo, beyond that the least
+# recently used ones are forgotten
+
+memoSize = 4096
+
+# type modules are executed again by every blueprint load, while this
+# module is imported once: memos are kept here, keyed by the code of the
+# memoized function (or the function itself for builtins), so all loads
+# of a type share them (an edited type module gets memos of its own)
+
+_memos = dict()
+
+def memoize(function):
+	key = getattr(function, '__code__', function)
+	memoized = _memos.get(key)
+	if memoized is None:
+		memoized = _memos.setdefault(key,
+			functools.lru_cache(maxsize=memoSize)(function))
+
+	return memoized
+
+
+def statistics(memoized):
+	info = memoized.cache_info()
+	return {
+		'hits': info.hits,
+		'misses': info.misses,
+		'size': info.currsize
+	}
+
+__all__ = [
+	"memoize",
+	"statistics"
+]
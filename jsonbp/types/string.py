@@ -14,23 +14,24 @@ def _format(value, specs):
 	return f'"{escaped}"'
 
 
+def _prepare(value, specs):
+	if type(value) is str:
+		return value
+
+	return jsonbp.backend.fragment_value(_format(value, specs))
+
+
 def _parse(value, specs):
 	if isinstance(value, jsonbp.unquoted_str):
-		return False, jsonbp.ErrorType.VALUE_PARSING
+		return False, (jsonbp.ErrorType.VALUE_PARSING, value)
 
 	strLength = len(value)
 	if not specs['minLength'] <= strLength <= specs['maxLength']:
-		return False, {
-			"error": jsonbp.ErrorType.INVALID_LENGTH,
-			"context": { "length": strLength }
-		}
+		return False, (jsonbp.ErrorType.INVALID_LENGTH, value)
 
 	fullFormat = f"^{specs['format']}$"
 	if re.search(fullFormat, value) is None:
-		return False, {
-			"error": jsonbp.ErrorType.INVALID_FORMAT,
-			"context": {}
-		}
+		return False, (jsonbp.ErrorType.INVALID_FORMAT, value)
 
 	return True, value
 
@@ -39,6 +40,7 @@ type_specs = {
 	'name': 'String',
 	'parser': _parse,
 	'formatter': _format,
+	'preparer': _prepare,
 	'defaults': _defaults
 }
 
@@ -0,0 +1,234 @@
+
+import os
+import sys
+import select
+import threading
+
+from . import parser
+from .error import print_error
+
+# inotify flags, see inotify(7)
+IN_MODIFY      = 0x00000002
+IN_ATTRIB      = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO    = 0x00000080
+IN_CREATE      = 0x00000100
+IN_DELETE      = 0x00000200
+IN_NONBLOCK    = 0o4000
+IN_CLOEXEC     = 0o2000000
+
+_watchedEvents = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE |
+	IN_MOVED_TO | IN_CREATE | IN_DELETE)
+
+# editors write files in several steps, wait for them to settle
+_settleDelay = 0.05
+
+#-------------------------------------------------------------------------------
+
+class Inotify:
+	"""Minimal ctypes binding, only used to wake the watcher up early."""
+
+	def __init__(self):
+		import ctypes
+		import ctypes.util
+
+		self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+		self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+		if self.fd < 0:
+			raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+		self.directories = set()
+
+	def watch(self, directory):
+		if directory in self.directories:
+			return
+
+		encoded = os.fsencode(directory)
+		if self.libc.inotify_add_watch(self.fd, encoded, _watchedEvents) >= 0:
+			self.directories.add(directory)
+
+	def drain(self):
+		try:
+			while os.read(self.fd, 65536): pass
+		except BlockingIOError:
+			pass
+
+	def close(self):
+		os.close(self.fd)
+
+
+def _fingerprint(path):
+	try: status = os.stat(path)
+	except OSError:
+		return None
+
+	return parser.fingerprintOf(status)
+
+#-------------------------------------------------------------------------------
+
+class BlueprintWatcher:
+	"""Background thread reloading cached blueprints whose files change.
+
+	Files of every blueprint cached by :func:`jsonbp.load_file` (and their
+	includes) are checked every `interval` seconds, against their state when
+	loaded. On Linux, inotify wakes the thread up as soon as their
+	directories change. Changed files and
+	the blueprints including them are parsed again and swapped into the
+	cache at once; if any fails, the previous blueprints are kept.
+	"""
+
+	def __init__(self, interval=1.0, on_reload=None, on_error=None, use_inotify=True):
+		self.interval = interval
+		self.on_reload = on_reload
+		self.on_error = on_error
+		self.fingerprints = dict()
+
+		self._checking = threading.Lock()
+		self._stopped = threading.Event()
+		self._inotify = None
+
+		if use_inotify and sys.platform.startswith('linux'):
+			try: self._inotify = Inotify()
+			except (OSError, AttributeError, TypeError): # pragma: no cover
+				self._inotify = None
+
+		# select() only takes sockets on Windows, so the pipe waking the
+		# thread up is only needed along with inotify, otherwise it sleeps
+		if self._inotify is not None:
+			self._wakeRead, self._wakeWrite = os.pipe()
+
+		self._thread = threading.Thread(target=self._run,
+			name='jsonbp-watcher', daemon=True)
+
+	def start(self):
+		self.check()
+		self._thread.start()
+		return self
+
+	def stop(self):
+		"""Stops watching, waiting for the thread to finish."""
+
+		if self._stopped.is_set():
+			return
+
+		self._stopped.set()
+		if self._inotify is not None:
+			os.write(self._wakeWrite, b'x')
+
+		if self._thread.is_alive():
+			self._thread.join()
+
+		if self._inotify is not None:
+			self._inotify.close()
+			os.close(self._wakeRead)
+			os.close(self._wakeWrite)
+
+	def check(self):
+		"""Looks for changed files once, reloading them.
+
+			Returns:
+				list: absolute paths of the reloaded files.
+
+		"""
+
+		with self._checking:
+			changed = list()
+			for path, loaded in self._tracked().items():
+				fingerprint = _fingerprint(path)
+				previous = self.fingerprints.get(path, loaded)
+				self.fingerprints[path] = fingerprint
+
+				if fingerprint != previous:
+					changed.append(path)
+
+			if len(changed) == 0:
+				return list()
+
+			# a file failing to parse is retried once changed again
+			try: reloaded = parser.reloadFiles(changed)
+			except Exception as e:
+				self._report_error(changed, e)
+				return list()
+
+		if self.on_reload is not None:
+			self.on_reload(reloaded)
+
+		return reloaded
+
+	#-----------------------------------------------------------------------------
+
+	def _tracked(self):
+		blueprints = [blueprint for _, blueprint in parser._fileCache.items()]
+		blueprints.extend(reference._blueprint
+			for reference in list(parser._references)
+			if reference._blueprint is not None)
+
+		# files seen for the first time are compared to their state when
+		# loaded, so changes made before the first check aren't missed
+
+		tracked = dict()
+		for blueprint in blueprints:
+			for source in blueprint._collect_sources():
+				if source.path is not None:
+					tracked.setdefault(source.path, source.fingerprint)
+
+		if self._inotify is not None:
+			for path in tracked:
+				self._inotify.watch(os.path.dirname(path))
+
+		return tracked
+
+	def _report_error(self, paths, error):
+		if self.on_error is not None:
+			self.on_error(paths, error)
+			return
+
+		msg = f"Unable to reload {', '.join(paths)} => {error}"
+		print_error(msg)
+
+	def _wait(self):
+		if self._inotify is None:
+			self._stopped.wait(self.interval)
+			return
+
+		waited = [self._wakeRead, self._inotify.fd]
+		ready, _, _ = select.select(waited, [], [], self.interval)
+		if self._inotify.fd in ready:
+			self._stopped.wait(_settleDelay)
+			self._inotify.drain()
+
+	def _run(self):
+		while not self._stopped.is_set():
+			# failures (including those of the callbacks) must not end the thread
+			try:
+				self._wait()
+				if not self._stopped.is_set():
+					self.check()
+
+			except Exception as e:
+				print_error(f"Unable to check blueprints for changes => {e}")
+				self._stopped.wait(self.interval)
+
+#-------------------------------------------------------------------------------
+
+def watch_blueprints(interval=1.0, on_reload=None, on_error=None):
+	"""Starts reloading cached blueprints whenever their files change.
+
+		Blueprints obtained from :func:`load_file` afterwards are the reloaded
+		ones, while those already in use remain valid and unchanged, so calls
+		in progress are never affected. Blueprints from :func:`load_string`
+		which include a changed file are evicted from the cache.
+
+		Args:
+			interval (float): seconds between checks for changes. On Linux,
+				changes are usually noticed right away.
+			on_reload (callable): called with the list of reloaded paths.
+			on_error (callable): called with the list of changed paths and
+				the exception when reloading fails, which otherwise is printed.
+
+		Returns:
+			BlueprintWatcher: the running watcher, whose stop() method ends it.
+
+	"""
+
+	return BlueprintWatcher(interval, on_reload, on_error).start()
@@ -0,0 +1,189 @@
+
+import os
+import os.path
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+sys.path.append('..')
+import jsonbp
+
+# Runs every scenario under 'performance', each one being a directory
+# with a blueprint.jbp and a content.py which, given 'size', fills the
+# 'content' dict with the 'valid' Python data and a 'corrupt' function
+# turning its JSON text into an invalid document.
+#
+# Usage (from the tests directory):
+#   python benchmark.py --save   run and store the results as the baseline
+#   python benchmark.py          run and compare with the baseline
+#
+# Timings only compare with others taken on the same machine and Python,
+# so the baseline is kept locally (it's ignored by git) and not shipped.
+
+performanceDir = 'performance'
+defaultBaseline = os.path.join(performanceDir, 'baseline.local.json')
+
+# tail latencies are too noisy on shared machines,
+# they are reported but left out of comparisons
+
+lowerIsBetter = ('p50_ms', 'peak_kb')
+higherIsBetter = ('docs_per_sec', 'mb_per_sec')
+
+
+def percentile(sortedTimings, fraction):
+	index = round(fraction * (len(sortedTimings) - 1))
+	return sortedTimings[index]
+
+
+def measure(operation, repeat, payloadSize=None):
+	# warming up
+	operation()
+
+	timings = list()
+	for _ in range(repeat):
+		start = time.perf_counter()
+		operation()
+		timings.append(time.perf_counter() - start)
+
+	# peak memory is taken apart, tracing slows everything down
+	tracemalloc.start()
+	operation()
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	timings.sort()
+	total = sum(timings)
+	metrics = {
+		'docs_per_sec': repeat / total,
+		'p50_ms': percentile(timings, 0.50) * 1000,
+		'p90_ms': percentile(timings, 0.90) * 1000,
+		'p99_ms': percentile(timings, 0.99) * 1000,
+		'peak_kb': peak / 1024
+	}
+
+	if payloadSize is not None:
+		metrics['mb_per_sec'] = payloadSize * repeat / total / (1024 * 1024)
+
+	return metrics
+
+
+def run_scenario(subdirPath, size, repeat):
+	blueprintFile = os.path.join(subdirPath, 'blueprint.jbp')
+	contentFile = os.path.join(subdirPath, 'content.py')
+
+	content = dict()
+	with open(contentFile) as rfd:
+		exec(rfd.read(), {'size': size, 'content': content})
+
+	blueprint = jsonbp.load_file(blueprintFile)
+	valid = content['valid']
+	serialized = blueprint.serialize(valid)
+	corrupted = content['corrupt'](serialized)
+	payloadSize = len(serialized.encode('utf-8'))
+
+	success, outcome = blueprint.deserialize(serialized)
+	assert success, f"{subdirPath}: valid content was refused"
+	success, _ = blueprint.deserialize(corrupted)
+	assert not success, f"{subdirPath}: corrupted content was accepted"
+
+	def load():
+		jsonbp.invalidate_cache()
+		jsonbp.load_file(blueprintFile)
+
+	return {
+		'load_file': measure(load, repeat),
+		'deserialize': measure(lambda: blueprint.deserialize(serialized), repeat, payloadSize),
+		'deserialize_error': measure(lambda: blueprint.deserialize(corrupted), repeat, len(corrupted)),
+		'serialize': measure(lambda: blueprint.serialize(outcome), repeat, payloadSize),
+		'encode': measure(lambda: blueprint.encode(outcome), repeat, payloadSize)
+	}
+
+
+def compare(results, baseline, tolerance):
+	regressions = list()
+
+	for scenario, operations in results.items():
+		for operation, metrics in operations.items():
+			reference = baseline.get(scenario, {}).get(operation)
+			if reference is None:
+				continue
+
+			for metric, value in metrics.items():
+				if not metric in reference:
+					continue
+
+				expected = reference[metric]
+				if metric in lowerIsBetter:
+					regressed = value > expected * (1 + tolerance)
+				elif metric in higherIsBetter:
+					regressed = value < expected * (1 - tolerance)
+				else:
+					regressed = False
+
+				if regressed:
+					regressions.append((scenario, operation, metric, expected, value))
+
+	return regressions
+
+
+def report(results):
+	header = f"{'scenario':<20} {'operation':<18} {'docs/s':>10} {'MB/s':>8} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'peak KB':>10}"
+	print(header)
+	print('-' * len(header))
+
+	for scenario, operations in results.items():
+		for operation, metrics in operations.items():
+			throughput = metrics.get('mb_per_sec')
+			throughput = f"{throughput:8.2f}" if throughput is not None else f"{'-':>8}"
+			print(f"{scenario:<20} {operation:<18} {metrics['docs_per_sec']:10.1f} {throughput} "
+				f"{metrics['p50_ms']:9.3f} {metrics['p90_ms']:9.3f} {metrics['p99_ms']:9.3f} {metrics['peak_kb']:10.1f}")
+
+
+def main():
+	parser = argparse.ArgumentParser(description='jsonbp benchmarks')
+	parser.add_argument('--size', type=int, default=200, help='documents scale')
+	parser.add_argument('--repeat', type=int, default=20, help='timed calls per operation')
+	parser.add_argument('--scenario', action='append', help='only run the given scenario(s)')
+	parser.add_argument('--baseline', default=defaultBaseline, help='results to compare with')
+	parser.add_argument('--tolerance', type=float, default=0.25, help='accepted relative slowdown')
+	parser.add_argument('--save', nargs='?', const=defaultBaseline,
+		help='file where results are stored, the baseline if not given')
+	args = parser.parse_args()
+
+	scenarios = sorted(f.name
+		for f in os.scandir(performanceDir)
+		if f.is_dir())
+
+	if args.scenario:
+		scenarios = [s for s in scenarios if s in args.scenario]
+
+	results = dict()
+	for scenario in scenarios:
+		subdirPath = os.path.join(performanceDir, scenario)
+		results[scenario] = run_scenario(subdirPath, args.size, args.repeat)
+
+	report(results)
+
+	if args.save:
+		with open(args.save, 'w') as wfd:
+			json.dump(results, wfd, indent=2)
+		return 0
+
+	if not os.path.isfile(args.baseline):
+		print(f"[WARN] No baseline at '{args.baseline}', nothing to compare (see --save)")
+		return 0
+
+	with open(args.baseline) as rfd:
+		baseline = json.load(rfd)
+
+	regressions = compare(results, baseline, args.tolerance)
+	for scenario, operation, metric, expected, value in regressions:
+		print(f"[REGRESSION] {scenario} {operation} {metric}: {expected:.3f} -> {value:.3f}")
+
+	return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,5 @@
+
+benchmark['result'] = {
+	"samples": [ -10.0, -2.5, 0.0, 3.75, 9.99 ],
+	"counters": [ 0, 1, 12, 1000 ]
+}
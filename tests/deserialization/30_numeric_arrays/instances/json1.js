@@ -0,0 +1,4 @@
+{
+	"samples": [ -10, -2.5, 0, "3.75", 9.99 ],
+	"counters": [ 0, 1, "12", 1000 ]
+}
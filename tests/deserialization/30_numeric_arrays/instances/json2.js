@@ -0,0 +1,4 @@
+{
+	"samples": [ -2.5, 0, 10 ],
+	"counters": []
+}
@@ -0,0 +1,4 @@
+{
+	"samples": [ -2.5, NaN, 3 ],
+	"counters": []
+}
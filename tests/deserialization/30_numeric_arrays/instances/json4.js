@@ -0,0 +1,4 @@
+{
+	"samples": [ -2.5, true, 3 ],
+	"counters": []
+}
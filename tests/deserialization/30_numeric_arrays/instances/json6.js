@@ -0,0 +1,4 @@
+{
+	"samples": [],
+	"counters": [ 1, 2.5, 3 ]
+}
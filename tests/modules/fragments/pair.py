@@ -0,0 +1,20 @@
+
+import json
+import jsonbp
+
+# written as a JSON array, of which formatters only return the text
+
+def _format(value, specs):
+	return json.dumps(list(value))
+
+
+def _parse(value, specs):
+	return True, tuple(value)
+
+
+type_specs = {
+	'name': 'Pair',
+	'parser': _parse,
+	'formatter': _format,
+	'defaults': dict()
+}
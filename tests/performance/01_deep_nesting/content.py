@@ -0,0 +1,19 @@
+
+kinds = ('LEAF', 'BRANCH', 'ROOT')
+
+def chain(level, seed):
+	node = {
+		"name": f"node {seed}.{level}",
+		"weight": (seed * 7 + level) / 8,
+		"kind": kinds[(seed + level) % 3]
+	}
+
+	if level < 11:
+		node["nested"] = [chain(level + 1, seed)]
+
+	return node
+
+content['valid'] = [chain(0, i) for i in range(size)]
+
+# the deepest node of the last chain gets an unknown literal
+content['corrupt'] = lambda text: text[::-1].replace('"FAEL"', '"FAELX"', 1)[::-1]
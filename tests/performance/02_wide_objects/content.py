@@ -0,0 +1,21 @@
+from decimal import Decimal
+from datetime import date, datetime, timezone
+
+def wide(seed):
+	builders = (
+		lambda i: seed * i,
+		lambda i: seed / (i + 1),
+		lambda i: f"value {seed}-{i}",
+		lambda i: (seed + i) % 2 == 0,
+		lambda i: Decimal(f"{seed}.{i % 1000:03d}"),
+		lambda i: datetime(2020, 1 + i % 12, 1 + seed % 28, i % 24, tzinfo=timezone.utc),
+		lambda i: date(2020, 1 + i % 12, 1 + seed % 28),
+		lambda i: (seed * i) % 1000
+	)
+
+	return {f"field{i:02d}": builders[i % 8](i) for i in range(64)}
+
+content['valid'] = [wide(i) for i in range(size)]
+
+# the last bounded field becomes negative
+content['corrupt'] = lambda text: text[:text.rindex('"field63":') + 10] + '-1' + text[text.rindex('}'):]
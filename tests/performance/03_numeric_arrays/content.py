@@ -0,0 +1,12 @@
+
+length = size * 100
+
+content['valid'] = {
+	"counters": [i * 31 - length for i in range(length)],
+	"bounded": [i % 1000000 for i in range(length)],
+	"samples": [(i - length / 2) / 3 for i in range(length)],
+	"ratios": [i / length for i in range(length)]
+}
+
+# one ratio out of the allowed range, at the very end
+content['corrupt'] = lambda text: text[:-2] + ',1.5]}'
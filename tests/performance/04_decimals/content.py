@@ -0,0 +1,15 @@
+from decimal import Decimal
+
+def entry(seed):
+	return {
+		"amount": Decimal(f"{seed * 137 % 100000}.{seed % 100:02d}"),
+		"fee": Decimal(f"-{seed % 50}.{seed % 7:02d}"),
+		"rate": Decimal(f"0.{seed * 7919 % 1000000:06d}"),
+		"display": Decimal(f"{seed * 1009}.{seed % 100:02d}"),
+		"balance": Decimal(f"{seed + 1}.{seed * 31 % 100000000:08d}")
+	}
+
+content['valid'] = [entry(i) for i in range(size)]
+
+# the last amount goes beyond what Money allows
+content['corrupt'] = lambda text: text[:text.rindex('"amount":') + 9] + '9999999' + text[text.rindex('"amount":') + 9:]
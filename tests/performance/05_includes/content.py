@@ -0,0 +1,17 @@
+
+states = ('IDLE', 'ACTIVE', 'DONE')
+
+def parts(seed):
+	return {
+		f"part{i:02d}": {
+			"id": seed * 12 + i,
+			"measure": (seed + i) / 4,
+			"state": states[(seed + i) % 3]
+		}
+		for i in range(1, 13)
+	}
+
+content['valid'] = [parts(i) for i in range(size)]
+
+# a negative id in the last part
+content['corrupt'] = lambda text: text[:text.rindex('"id":') + 5] + '-' + text[text.rindex('"id":') + 5:]
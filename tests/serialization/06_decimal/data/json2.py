@@ -0,0 +1,7 @@
+
+data['input'] = {
+	"income": Decimal("1000000"),
+	"expenses": Decimal("0.5"),
+	"balance": Decimal("-123456.78"),
+	"debt": Decimal("-12345678")
+}
@@ -0,0 +1,5 @@
+
+data['input'] = {
+	"income": "one million",
+	"expenses": Decimal("0.5")
+}
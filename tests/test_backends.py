@@ -0,0 +1,127 @@
+
+import json
+import pytest
+from decimal import Decimal
+from datetime import date, datetime, timezone
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+class CountingBackend(jsonbp.JsonBackend):
+	name = 'counting'
+
+	def __init__(self):
+		self.stdlib = jsonbp.backend.StdlibBackend()
+		self.calls = 0
+
+	def decode(self, contents):
+		self.calls += 1
+		return self.stdlib.decode(contents)
+
+
+def testDecodingBackend():
+	blueprint = jsonbp.load_string('''root { amount: Decimal (precision=20), paid: Bool }''')
+	instance = '{"amount": 0.12345678901234567890, "paid": true}'
+	expected = {"amount": Decimal("0.12345678901234567890"), "paid": True}
+
+	with pytest.raises(ValueError):
+		jsonbp.use_json_backend('nonExistent')
+
+	backend = CountingBackend()
+	jsonbp.register_json_backend(backend)
+	jsonbp.use_json_backend('counting')
+
+	try:
+		assert blueprint.deserialize(instance) == (True, expected)
+		success, outcome = blueprint.deserialize('{"amount": 1')
+		assert not success and outcome.error_type() == jsonbp.ErrorType.JSON_PARSING
+		assert backend.calls == 2
+
+	finally:
+		jsonbp.use_json_backend('json')
+
+	assert blueprint.deserialize(instance) == (True, expected)
+	assert backend.calls == 2
+
+
+def testEncodingBackend():
+	blueprint = jsonbp.load_string('''root { amount: Decimal (precision=20), ratio: Float (allowNaN=true), label: String }''')
+	content = {"amount": Decimal("0.12345678901234567890"), "ratio": float('nan'), "label": 'say "hi"'}
+	compact = '{"amount":0.12345678901234567890,"ratio":NaN,"label":"say \\"hi\\""}'
+
+	assert blueprint.encode(content) == compact
+	assert blueprint.encode(content, indent=2) == (
+		'{\n  "amount": 0.12345678901234567890,\n  "ratio": NaN,\n  "label": "say \\"hi\\""\n}')
+
+	# strings resembling verbatim values are still written as strings
+	forged = dict(content, label='\x00' + jsonbp.backend._nonce[::-1] + ':1\x00')
+	success, outcome = blueprint.deserialize(blueprint.encode(forged, indent=2))
+	assert success and outcome['label'] == forged['label']
+
+	with pytest.raises(jsonbp.SerializationException):
+		blueprint.encode({"ratio": 0.5, "label": "missing amount"})
+
+	if 'orjson' in jsonbp.backend._backends:
+		indented = blueprint.encode(content, indent=2)
+		jsonbp.use_json_backend('orjson')
+		try: assert blueprint.encode(content, indent=2) == indented
+		finally: jsonbp.use_json_backend('json')
+
+
+def testEncodingMatchesSerialization():
+	blueprint = jsonbp.load_string('''
+		enum Color { RED, GREEN }
+
+		object Entry {
+			count: Integer,
+			big: Integer,
+			ratio: Float,
+			precise: Float (format="%.2f"),
+			wide: Float,
+			whole: Float,
+			nan: Float (allowNaN=true),
+			amount: Decimal,
+			localized: Decimal (precision=3, separator=".", radix=",", prefix="R$ "),
+			plain: Decimal (precision=4),
+			paid: Bool,
+			label: String,
+			moment: Instant,
+			custom: Instant (iso=false, format="%Y%m%d%H%M%S"),
+			day: Date,
+			color: Color,
+			pair: Pair,
+			optional note: nullable String
+		}
+
+		root Entry[]
+	''', custom_types=['modules/fragments'])
+
+	entry = {
+		"count": -12, "big": 2 ** 70, "ratio": 1.5, "precise": 1.5, "wide": 1234567.0,
+		"whole": 2.0, "nan": float('nan'), "amount": Decimal("-1234.56"),
+		"localized": Decimal("1234567.891"), "plain": Decimal("0.1000"), "paid": True,
+		"label": 'say "hi" to José', "moment": datetime(2024, 5, 6, 10, 11, 12, tzinfo=timezone.utc),
+		"custom": datetime(2024, 5, 6, 10, 11, 12), "day": date(2024, 5, 6),
+		"color": "GREEN", "pair": ("a", "b"), "note": None
+	}
+
+	content = [entry, dict(entry, note="x", pair=("c", 'd"'))]
+	serialized = blueprint.serialize(content)
+	assert blueprint.encode(content) == serialized
+
+	# indented output only differs by whitespace, whatever the encoder
+	verbatim = lambda text: json.loads(text, parse_float=str, parse_int=str, parse_constant=str)
+	for backend in jsonbp.backend._backends:
+		jsonbp.use_json_backend(backend)
+		try: indented = blueprint.encode(content, indent=2)
+		finally: jsonbp.use_json_backend('json')
+
+		assert indented != serialized
+		assert verbatim(indented) == verbatim(serialized)
+
+
+if __name__ == "__main__":
+	testDecodingBackend()
+	testEncodingBackend()
+	testEncodingMatchesSerialization()
@@ -0,0 +1,66 @@
+
+import os
+import tempfile
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+def write(path, contents):
+	with open(path, 'w') as fd:
+		fd.write(contents)
+
+
+def testBlueprintRef():
+	jsonbp.invalidate_cache()
+	directory = 'deserialization/21_include_nested'
+
+	reference = jsonbp.blueprint_ref(f'{directory}/blueprint.jbp')
+	standalone = jsonbp.blueprint_ref('login.jbp')
+	blueprint = reference.get()
+
+	assert blueprint is jsonbp.load_file(f'{directory}/blueprint.jbp')
+	assert reference.get() is blueprint
+
+	# only handles depending on the invalidated file are refreshed
+	login = standalone.get()
+	jsonbp.invalidate_cache(f'{directory}/point.jbp')
+	assert standalone.get() is login
+
+	refreshed = reference.get()
+	assert refreshed is not blueprint
+	assert refreshed is jsonbp.load_file(f'{directory}/blueprint.jbp')
+
+	jsonbp.invalidate_cache()
+	assert standalone.get() is not login
+
+
+def testBlueprintRefReload():
+	jsonbp.invalidate_cache()
+
+	with tempfile.TemporaryDirectory() as directory:
+		rootFile = os.path.join(directory, 'root.jbp')
+		write(rootFile, 'root { amount: Integer (min=0) }\n')
+
+		reference = jsonbp.blueprint_ref(rootFile)
+		original = reference.get()
+
+		watcher = jsonbp.watcher.BlueprintWatcher(use_inotify=False)
+		watcher.check()
+
+		write(rootFile, 'root { amount: Integer (min=-100) }\n')
+		assert watcher.check() == [rootFile]
+
+		current = reference.get()
+		assert current is not original
+		assert current is jsonbp.load_file(rootFile)
+		assert current.deserialize('{"amount": -5}')[0]
+
+		watcher.stop()
+
+	jsonbp.invalidate_cache()
+
+
+if __name__ == "__main__":
+	testBlueprintRef()
+	testBlueprintRefReload()
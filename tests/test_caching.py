@@ -1,4 +1,7 @@
 
+import os
+import pytest
+
 import sys
 sys.path.append('..')
 import jsonbp
@@ -13,6 +16,103 @@ def testCaching():
 	blueprint3 = jsonbp.load_file(blueprintFile)
 	assert blueprint3 != blueprint1
 
+
+def testStringCaching():
+	jsonbp.invalidate_cache()
+	before = jsonbp.cache_statistics()['strings']
+
+	blueprint1 = jsonbp.load_string('root { x: Integer }')
+	blueprint2 = jsonbp.load_string('root { x: Integer }')
+	blueprint3 = jsonbp.load_string('root { x: Float }')
+	assert blueprint1.root is blueprint2.root
+	assert blueprint3.root is not blueprint1.root
+
+	# every caller gets its own instance, changing one leaves the others be
+	assert blueprint1 is not blueprint2
+	blueprint1.enable_metrics()
+	assert blueprint2.metrics is None
+
+	after = jsonbp.cache_statistics()['strings']
+	assert after['size'] == 2
+	assert after['hits'] - before['hits'] == 1
+	assert after['misses'] - before['misses'] == 2
+
+	jsonbp.invalidate_cache()
+	assert jsonbp.load_string('root { x: Integer }').root is not blueprint1.root
+
+
+def testLeastRecentlyUsed():
+	jsonbp.invalidate_cache()
+	files = [f'deserialization/{subdir}/blueprint.jbp'
+		for subdir in ('00_integer', '03_float', '05_string')]
+
+	with pytest.raises(ValueError):
+		jsonbp.set_cache_size(files=-1)
+
+	try:
+		jsonbp.set_cache_size(files=2, strings=0)
+		first, second, third = [jsonbp.load_file(f) for f in files]
+
+		# the first file was evicted to make room for the third one
+		statistics = jsonbp.cache_statistics()['files']
+		assert statistics['size'] == 2 and statistics['evictions'] >= 1
+		assert jsonbp.load_file(files[2]) is third
+		assert jsonbp.load_file(files[0]) is not first
+
+		# and now the second one is gone
+		assert jsonbp.load_file(files[2]) is third
+		assert jsonbp.load_file(files[1]) is not second
+
+		assert jsonbp.load_string('root Integer').root is not jsonbp.load_string('root Integer').root
+
+	finally:
+		jsonbp.set_cache_size(files=1024, strings=128)
+
+
+def testSelectiveInvalidation():
+	jsonbp.invalidate_cache()
+	directory = 'deserialization/21_include_nested'
+	names = ('blueprint', 'colored_point', 'color', 'point')
+	loaded = {name: jsonbp.load_file(f'{directory}/{name}.jbp') for name in names}
+	standalone = jsonbp.load_file('login.jbp')
+	including = jsonbp.load_string(f'include "{directory}/point.jbp"\nroot Point')
+
+	# colored_point.jbp includes point.jbp, and blueprint.jbp includes colored_point.jbp
+	jsonbp.invalidate_cache(f'{directory}/point.jbp')
+
+	reloaded = {name: jsonbp.load_file(f'{directory}/{name}.jbp') for name in names}
+	assert reloaded['color'] is loaded['color']
+	assert jsonbp.load_file('login.jbp') is standalone
+
+	for name in ('blueprint', 'colored_point', 'point'):
+		assert reloaded[name] is not loaded[name]
+
+	assert reloaded['blueprint'].path == os.path.abspath(f'{directory}/blueprint.jbp')
+	assert jsonbp.load_string(f'include "{directory}/point.jbp"\nroot Point').includes[0] is not including.includes[0]
+
+
+def testDiamondIncludes():
+	# both blueprint.jbp and colored_point.jbp include color.jbp, whose
+	# blueprint is shared even when the cache can't keep it
+	blueprintFile = 'deserialization/21_include_nested/blueprint.jbp'
+
+	try:
+		for size in (0, 1, 2):
+			jsonbp.invalidate_cache()
+			jsonbp.set_cache_size(files=size)
+
+			blueprint = jsonbp.load_file(blueprintFile)
+			color, colored_point = blueprint.includes
+			assert colored_point.includes[0] is color
+			assert jsonbp.cache_statistics()['files']['size'] <= size
+
+	finally:
+		jsonbp.set_cache_size(files=1024)
+
+
 if __name__ == "__main__":
 	testCaching()
-
+	testStringCaching()
+	testLeastRecentlyUsed()
+	testSelectiveInvalidation()
+	testDiamondIncludes()
@@ -0,0 +1,56 @@
+
+import pytest
+
+blueprint_txt = """
+
+	root {
+		sensor: Integer (min=0),
+		reading: Float (atLeast=-50, atMost=150),
+		valid: Bool,
+		optional label: String
+	} [minLength=1]
+
+"""
+
+json_txt = """
+
+[
+	{ "sensor": 1, "reading": 21.5, "valid": true },
+	{ "sensor": 2, "reading": -3.25, "valid": false, "label": "outdoor" },
+	{ "sensor": 3, "reading": 99, "valid": true }
+]
+
+"""
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+def testColumns():
+	blueprint = jsonbp.load_string(blueprint_txt)
+	success, columns = blueprint.deserialize_columns(json_txt)
+	assert success
+
+	assert list(columns['sensor']) == [1, 2, 3]
+	assert list(columns['reading']) == [21.5, -3.25, 99.0]
+	assert [bool(v) for v in columns['valid']] == [True, False, True]
+	assert columns['label'] == [None, "outdoor", None]
+
+	success, outcome = blueprint.deserialize_columns('[{ "sensor": 1, "reading": 200, "valid": true }]')
+	assert not success and outcome.error_type() == jsonbp.ErrorType.OUTSIDE_RANGE
+
+	success, outcome = blueprint.deserialize_columns('[]')
+	assert not success and outcome.error_type() == jsonbp.ErrorType.INVALID_LENGTH
+
+	# problems are reported just like deserialize() does
+	for invalid in ('[]', '{"sensor": 1}', '[{ "sensor": 1, "reading": 2, "valid": true }, null]'):
+		_, expected = blueprint.deserialize(invalid)
+		_, outcome = blueprint.deserialize_columns(invalid)
+		assert (outcome.error_type(), outcome.path, str(outcome)) == (expected.error_type(), expected.path, str(expected))
+
+	with pytest.raises(jsonbp.SchemaViolation):
+		jsonbp.load_string('root { x: Integer }').deserialize_columns('{"x": 1}')
+
+
+if __name__ == "__main__":
+	testColumns()
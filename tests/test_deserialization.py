@@ -90,9 +90,20 @@ def testDeserializations():
 			shouldSucceed = "OK" == expectedOutcome
 
 			with open(jsonFile, "r") as fd:
-				outcome, obtainedResult = blueprint.deserialize(fd.read())
+				contents = fd.read()
+				outcome, obtainedResult = blueprint.deserialize(contents)
 				correct = (outcome == shouldSucceed)
 
+				checked, checkedError = blueprint.check(contents)
+				assert checked == outcome
+
+				encoded = contents.encode('utf-8')
+				fromBytes, _ = blueprint.deserialize(memoryview(encoded))
+				assert fromBytes == outcome
+
+				fromFile, _ = blueprint.deserialize_file(jsonFile)
+				assert fromFile == outcome
+
 				if not correct:
 					print('Failed!')
 					print(f'Expected outcome = {shouldSucceed}')
@@ -112,6 +123,7 @@ def testDeserializations():
 						print(f'Obtained error id = {returnedError}')
 
 					assert returnedIsExpected
+					assert checkedError.error_type() == returnedError
 
 				else:
 					subdirPath = os.path.join(verificationDir, key)
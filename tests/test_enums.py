@@ -0,0 +1,76 @@
+
+import enum
+import pytest
+
+blueprint_txt = """
+
+	enum Currency {
+		BRL,
+		USD,
+		EUR
+	}
+
+	root {
+		paid: Currency,
+		accepted: Currency[]
+	}
+
+"""
+
+json_txt = """{ "paid": "USD", "accepted": ["EUR", "BRL"] }"""
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+def testEnumOutputs():
+	blueprint = jsonbp.load_string(blueprint_txt)
+	currency = blueprint.enums['Currency']
+	assert currency.constants == ('BRL', 'USD', 'EUR')
+
+	success, outcome = blueprint.deserialize(json_txt)
+	assert success and outcome == {"paid": "USD", "accepted": ["EUR", "BRL"]}
+
+	asMembers = blueprint.with_output(enums=jsonbp.EnumOutput.MEMBER)
+	success, outcome = asMembers.deserialize(json_txt)
+	assert success and isinstance(outcome['paid'], enum.Enum)
+	assert outcome['paid'] is currency.python_enum['USD']
+	assert asMembers.serialize(outcome) == blueprint.serialize({"paid": "USD", "accepted": ["EUR", "BRL"]})
+
+	asOrdinals = blueprint.with_output(enums=jsonbp.EnumOutput.ORDINAL)
+	success, outcome = asOrdinals.deserialize(json_txt)
+	assert success and outcome == {"paid": 1, "accepted": [2, 0]}
+	assert asOrdinals.deserialize(asOrdinals.serialize(outcome)) == (True, outcome)
+
+	success, outcome = asOrdinals.deserialize('{ "paid": "JPY", "accepted": [] }')
+	assert not success and outcome.error_type() == jsonbp.ErrorType.UNKNOWN_LITERAL
+
+	for invalid in ("JPY", 3, True, ["USD"]):
+		with pytest.raises(jsonbp.SerializationException):
+			blueprint.serialize({"paid": invalid, "accepted": []})
+
+	# members and ordinals are only taken back by blueprints that output them
+	for invalid in (1, currency.python_enum['USD']):
+		with pytest.raises(jsonbp.SerializationException):
+			blueprint.serialize({"paid": invalid, "accepted": []})
+
+	with pytest.raises(jsonbp.SerializationException):
+		asMembers.serialize({"paid": 1, "accepted": []})
+
+	with pytest.raises(jsonbp.SerializationException):
+		asOrdinals.serialize({"paid": currency.python_enum['USD'], "accepted": []})
+
+	assert asOrdinals.serialize({"paid": "USD", "accepted": [0]}) == '{"paid":"USD","accepted":["BRL"]}'
+
+
+def testUnfitMembers():
+	blueprint = jsonbp.load_string('enum Reserved { _sunder_, PLAIN } root { value: Reserved }')
+	assert blueprint.with_output(enums=jsonbp.EnumOutput.ORDINAL).deserialize('{"value": "PLAIN"}') == (True, {"value": 1})
+
+	with pytest.raises(jsonbp.SchemaViolation):
+		blueprint.with_output(enums=jsonbp.EnumOutput.MEMBER)
+
+
+if __name__ == "__main__":
+	testEnumOutputs()
+	testUnfitMembers()
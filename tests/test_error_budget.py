@@ -0,0 +1,77 @@
+
+import pytest
+
+blueprint_txt = """
+
+	object Item {
+		sku: String (maxLength=8),
+		quantity: Integer (min=1)
+	}
+
+	root {
+		order: Integer,
+		items: Item[],
+		status: { OPEN, CLOSED }
+	}
+
+"""
+
+json_txt = """
+
+{
+	"order": "first",
+	"items": [
+		{ "sku": "A-1", "quantity": 0 },
+		{ "sku": "B-2", "quantity": 2 },
+		{ "sku": "far-too-long", "quantity": -1 }
+	],
+	"status": "LOST"
+}
+
+"""
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+def testErrorBudget():
+	blueprint = jsonbp.load_string(blueprint_txt)
+
+	success, outcome = blueprint.deserialize(json_txt)
+	assert not success and isinstance(outcome, jsonbp.DeserializationError)
+	assert outcome.path == "/order"
+
+	success, errors = blueprint.deserialize(json_txt, max_errors=10)
+	assert not success and [e.error_type() for e in errors] == [
+		jsonbp.ErrorType.VALUE_PARSING,
+		jsonbp.ErrorType.OUTSIDE_RANGE,
+		jsonbp.ErrorType.INVALID_LENGTH,
+		jsonbp.ErrorType.OUTSIDE_RANGE,
+		jsonbp.ErrorType.UNKNOWN_LITERAL
+	]
+
+	assert [e.index for e in errors[1:4]] == [0, 2, 2]
+	assert [e.path for e in errors] == [
+		"/order",
+		"/items/0/quantity",
+		"/items/2/sku",
+		"/items/2/quantity",
+		"/status"
+	]
+
+	success, errors = blueprint.deserialize(json_txt, max_errors=2)
+	assert not success and len(errors) == 2
+
+	success, errors = blueprint.deserialize('{"order": 1', max_errors=2)
+	assert not success and errors[0].error_type() == jsonbp.ErrorType.JSON_PARSING
+	assert errors[0].path == ""
+
+	success, outcome = blueprint.deserialize('{"order": 1, "items": [], "status": "OPEN"}', max_errors=2)
+	assert success and outcome['status'] == "OPEN"
+
+	with pytest.raises(ValueError):
+		blueprint.deserialize(json_txt, max_errors=0)
+
+
+if __name__ == "__main__":
+	testErrorBudget()
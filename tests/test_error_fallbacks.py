@@ -12,8 +12,40 @@ def testLocaleEdges():
 	print(outcome.localize(["it_IT", "pt_BR", "en_US"]))
 	jsonbp.use_default_language('nonExistent')
 	print(str(outcome))
+	jsonbp.use_default_language('en_US')
+
+	# priorities may come from any iterable
+	assert outcome.localize(iter(["it_IT", "pt_BR"])) == outcome.localize(["pt_BR"])
+	assert outcome.localize(iter(["pt_BR"])) != outcome.localize(["en_US"])
+
+
+def testLazyContext():
+	blueprint = jsonbp.load_string('''root { amount: Float (atMost=10), name: String (maxLength=3) }''')
+
+	success, outcome = blueprint.deserialize('{"amount": 1e3, "name": "abc"}')
+	assert not success and outcome.error_type() == jsonbp.ErrorType.OUTSIDE_RANGE
+
+	# only the rejected value is kept until the context is needed
+	assert outcome._merged is None and outcome._rejected == '1e3'
+	assert str(outcome) == "Field 'amount': Value 1e3 is outside expected range"
+	assert outcome.context == {"value": "1e3", "type": "Float"}
+
+	success, outcome = blueprint.deserialize('{"amount": 1, "name": "abcd"}')
+	assert outcome.context == {"length": 4, "type": "String"}
+
+	# errors still take whatever callers assign to them
+	outcome.context = {"length": 5}
+	outcome.reviewed = True
+	assert outcome.context == {"length": 5} and outcome.reviewed
+
+
+def testTemplates():
+	assert jsonbp.error.compile_template('a {{b}}')({}) == 'a {b}'
+	assert jsonbp.error.compile_template('a {b}')({'b': 1}) == 'a 1'
 
 
 if __name__ == "__main__":
 	testLocaleEdges()
+	testLazyContext()
+	testTemplates()
 
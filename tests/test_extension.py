@@ -0,0 +1,69 @@
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+blueprint_txt = """
+
+	object Point {
+		x: Integer,
+		y: Integer
+	}
+
+	object ColoredPoint extends Point {
+		color: String
+	}
+
+	object LabeledPoint extends ColoredPoint {
+		optional label: String
+	}
+
+	root LabeledPoint[]
+
+"""
+
+def testExtension():
+	blueprint = jsonbp.load_string(blueprint_txt)
+	point = blueprint.objects['Point']
+	colored = blueprint.objects['ColoredPoint']
+	labeled = blueprint.objects['LabeledPoint']
+
+	# only declared fields are kept, the base layout is reused as is
+	assert list(labeled.declared) == ['label']
+	assert labeled.base is colored and colored.base is point
+	assert labeled.layout[:len(colored.layout)] == colored.layout
+	assert all(mine is theirs for mine, theirs in zip(labeled.layout, point.layout))
+
+	assert list(labeled) == ['x', 'y', 'color', 'label']
+	assert list(labeled.fields) == ['x', 'y', 'color', 'label']
+	assert 'x' in labeled and 'label' not in colored
+	assert len(labeled) == 4
+
+	# declarations still read like the dicts of fields they used to be
+	assert labeled['x'] is point['x'] and labeled.get('missing') is None
+	assert list(labeled.keys()) == ['x', 'y', 'color', 'label']
+	assert [name for name, _ in labeled.items()] == list(labeled.keys())
+	assert list(labeled.values()) == [field for _, field in labeled.layout]
+	assert dict(labeled) == dict(labeled.fields)
+
+	content = [{"label": "origin", "color": "red", "y": 0, "x": 0}, {"color": "blue", "y": 2, "x": 1}]
+	serialized = blueprint.serialize(content)
+	assert serialized == '[{"x":0,"y":0,"color":"red","label":"origin"},{"x":1,"y":2,"color":"blue"}]'
+	assert blueprint.deserialize(serialized) == (True, content)
+
+	records = blueprint.with_output(objects=jsonbp.ObjectOutput.RECORD)
+	success, outcome = records.deserialize(serialized)
+	assert success
+	assert isinstance(outcome[0], point.record_type)
+	assert labeled.record_type.__slots__ == ('label',)
+	assert outcome[1]._asdict() == content[1]
+	assert records.serialize(outcome) == serialized
+
+	success, columns = blueprint.deserialize_columns(serialized)
+	assert success
+	assert list(columns) == ['x', 'y', 'color', 'label']
+	assert columns['label'] == ['origin', None]
+
+
+if __name__ == "__main__":
+	testExtension()
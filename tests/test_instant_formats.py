@@ -0,0 +1,60 @@
+
+from datetime import datetime, timezone, timedelta
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+def testInstantFormats():
+	blueprint = jsonbp.load_string('''
+		type Compact : Instant (iso=false, format="%Y%m%d%H%M%S", cache=false)
+		type Stamped : Instant (iso=false, format="%Y-%m-%dT%H:%M:%S.%f%z", cache=false)
+		type Spelled : Instant (iso=false, format="%d %b %Y", cache=false)
+
+		root {
+			compact: Compact,
+			stamped: Stamped,
+			short: Instant (iso=false, format="%d/%m/%y"),
+			spelled: Spelled
+		}
+	''')
+
+	assert blueprint.derived_types['Compact']['__reader__'] is not None
+	assert blueprint.derived_types['Stamped']['__reader__'] is not None
+	# month names depend on the locale, strptime handles them
+	assert blueprint.derived_types['Spelled']['__reader__'] is None
+	assert blueprint.primitive_types['Instant']['defaults']['__reader__'] is None
+
+	success, outcome = blueprint.deserialize('''{
+		"compact": "20240506101112",
+		"stamped": "2024-05-06T10:11:12.5-03:30",
+		"short": "06/05/24",
+		"spelled": "06 May 2024"
+	}''')
+
+	assert success
+	assert outcome['compact'] == datetime(2024, 5, 6, 10, 11, 12)
+	offset = timezone(-timedelta(hours=3, minutes=30))
+	assert outcome['stamped'] == datetime(2024, 5, 6, 10, 11, 12, 500000, tzinfo=offset)
+	assert outcome['stamped'].utcoffset() == offset.utcoffset(None)
+	assert outcome['short'] == datetime(2024, 5, 6)
+	assert outcome['spelled'] == datetime(2024, 5, 6)
+
+	# values laid out differently go through strptime, which decides
+	values = ['2024056101112', '20240506 101112', '20241306101112', '2024050610111Z']
+	for value in values:
+		try: expected = datetime.strptime(value, "%Y%m%d%H%M%S")
+		except ValueError: expected = None
+
+		content = f'{{"compact": "{value}", "stamped": "2024-05-06T10:11:12.5Z", "short": "06/05/24", "spelled": "06 May 2024"}}'
+		success, outcome = blueprint.deserialize(content)
+		assert success == (expected is not None)
+		if success:
+			assert outcome['compact'] == expected
+
+	success, outcome = blueprint.deserialize('{"compact": "20240506101112", "stamped": "2024-05-06T10:11:12.5Z", "short": "06/05/24", "spelled": "06 May 2024"}')
+	assert success and outcome['stamped'].tzinfo is timezone.utc
+
+
+if __name__ == "__main__":
+	testInstantFormats()
@@ -0,0 +1,64 @@
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+def testLoadReport():
+	jsonbp.invalidate_cache()
+	reports = list()
+
+	blueprintFile = 'deserialization/21_include_nested/blueprint.jbp'
+	blueprint = jsonbp.load_file(blueprintFile, report_hook=reports.append)
+	report = blueprint.load_report
+
+	assert reports == [report]
+	assert report.path == blueprintFile
+	assert report.objects_created == 1 and report.adhoc_types == 1
+
+	phases = report.read + report.lexer + report.parser + report.types + report.parse
+	included = sum(elapsed for _, elapsed, _ in report.includes)
+	assert 0 < phases + included <= report.total
+
+	# colored_point.jbp includes color.jbp again, which is cached by then
+	includes = [(path.split('/')[-1], included is None)
+		for path, _, included in report.includes]
+	assert includes == [('color.jbp', False), ('colored_point.jbp', False)]
+
+	colored = report.includes[1][2]
+	assert [(path.split('/')[-1], included is None)
+		for path, _, included in colored.includes] == [('color.jbp', True), ('point.jbp', False)]
+
+	point = colored.includes[1][2]
+	assert (point.types_created, point.objects_created, point.adhoc_types) == (1, 1, 1)
+
+	exported = report.as_dict()
+	assert exported['includes'][1]['report']['includes'][0]['report'] is None
+
+	# includes evicted meanwhile are still reused within the same load
+	jsonbp.invalidate_cache()
+	jsonbp.set_cache_size(files=0)
+	try:
+		evicted = jsonbp.load_file(blueprintFile).load_report
+		colored = evicted.includes[1][2]
+		assert [(path.split('/')[-1], included is None)
+			for path, _, included in colored.includes] == [('color.jbp', True), ('point.jbp', False)]
+
+	finally:
+		jsonbp.set_cache_size(files=1024)
+		jsonbp.invalidate_cache()
+
+	blueprint = jsonbp.load_file(blueprintFile, report_hook=reports.append)
+
+	# cached loads aren't reported again
+	assert jsonbp.load_file(blueprintFile, report_hook=reports.append) is blueprint
+	assert len(reports) == 2
+
+	loaded = jsonbp.load_string('root { x: Integer (min=0) }', report_hook=reports.append)
+	assert reports[-1] is loaded.load_report
+	assert loaded.load_report.path is None
+	assert loaded.load_report.types_created == 1
+	assert loaded.with_output().load_report is loaded.load_report
+
+
+if __name__ == "__main__":
+	testLoadReport()
@@ -0,0 +1,112 @@
+
+import os
+import pytest
+import tempfile
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+blueprintText = '''
+type Coordinate : Integer (min=0)
+enum Color { RED, GREEN }
+
+object Point {
+	x: Coordinate,
+	y: Coordinate,
+	color: Color
+}
+
+root {
+	points: Point[],
+	counters: Integer[]
+}
+'''
+
+def testMetrics():
+	blueprint = jsonbp.load_string(blueprintText)
+	assert blueprint.metrics is None
+
+	events = list()
+	metrics = blueprint.enable_metrics(events.append)
+	assert blueprint.metrics is metrics
+
+	valid = '{"points": [{"x": 1, "y": 2, "color": "RED"}, {"x": 3, "y": 4, "color": "GREEN"}], "counters": [1, 2, 3]}'
+	invalid = '{"points": [{"x": 1, "y": -2, "color": "RED"}], "counters": []}'
+
+	success, outcome = blueprint.deserialize(valid)
+	assert success
+	assert not blueprint.deserialize(invalid)[0]
+	assert not blueprint.deserialize('{"points": ')[0]
+	serialized = blueprint.serialize(outcome)
+
+	with pytest.raises(jsonbp.SerializationException):
+		blueprint.serialize({"points": [{"x": 1}], "counters": []})
+
+	snapshot = metrics.snapshot()
+	deserialize = snapshot['operations']['deserialize']
+	assert deserialize['calls'] == 3
+	assert deserialize['bytes'] == len(valid) + len(invalid) + len('{"points": ')
+	assert deserialize['failures'] == {'OUTSIDE_RANGE': 1, 'JSON_PARSING': 1}
+	assert deserialize['time'] > 0
+
+	serialize = snapshot['operations']['serialize']
+	assert serialize['calls'] == 2
+	assert serialize['bytes'] == len(serialized)
+	assert serialize['failures'] == {'SerializationException': 1}
+
+	deserialization = snapshot['deserialization']
+	assert deserialization['objects']['Point']['calls'] == 3
+	assert deserialization['objects']['Point']['failures'] == {'OUTSIDE_RANGE': 1}
+	assert deserialization['fields']['points.y']['calls'] == 3
+	assert deserialization['fields']['root.counters']['calls'] == 1
+	assert deserialization['types']['Color']['calls'] == 2
+	assert deserialization['types']['Coordinate']['calls'] == 6
+	assert deserialization['types']['Coordinate']['failures'] == {'OUTSIDE_RANGE': 1}
+	# counters are parsed in batch, but still counted per element
+	assert deserialization['types']['Integer']['calls'] == 3
+
+	serialization = snapshot['serialization']
+	assert serialization['objects']['Point']['calls'] == 3
+	assert serialization['objects']['Point']['failures'] == {'SerializationException': 1}
+
+	assert [event['operation'] for event in events] == ['deserialize'] * 3 + ['serialize'] * 2
+	assert [event['success'] for event in events] == [True, False, False, True, False]
+
+	# files are counted as deserialize calls, streamed or not
+	metrics.reset()
+	with tempfile.TemporaryDirectory() as directory:
+		filepath = os.path.join(directory, 'points.json')
+		with open(filepath, 'w') as fd: fd.write(valid)
+		assert blueprint.deserialize_file(filepath) == (True, outcome)
+
+		streamed = blueprint.choose_root('Point', as_array=True)
+		streamed.enable_metrics()
+		with open(filepath, 'w') as fd: fd.write('[{"x": 1, "y": 2, "color": "RED"}, {"x": 1, "y": 2, "color": "BLUE"}]')
+		assert not streamed.deserialize_file(filepath)[0]
+
+	assert metrics.snapshot()['operations']['deserialize']['bytes'] == len(valid)
+	snapshot = streamed.metrics.snapshot()
+	assert snapshot['operations']['deserialize']['failures'] == {'UNKNOWN_LITERAL': 1}
+	assert snapshot['deserialization']['objects']['Point']['calls'] == 2
+
+	assert blueprint.check(valid) == (True, None)
+	assert not blueprint.check(invalid)[0]
+	check = metrics.snapshot()['operations']['check']
+	assert check['calls'] == 2 and check['bytes'] == len(valid) + len(invalid)
+	assert check['failures'] == {'OUTSIDE_RANGE': 1}
+	assert [event['operation'] for event in events[5:]] == ['deserialize', 'check', 'check']
+	snapshot = metrics.snapshot()
+
+	# derived blueprints start without metrics
+	assert blueprint.with_output().metrics is None
+
+	blueprint.disable_metrics()
+	assert blueprint.metrics is None
+	assert blueprint.deserialize(valid) == (True, outcome)
+	assert metrics.snapshot() == snapshot
+	assert len(events) == 8
+
+
+if __name__ == "__main__":
+	testMetrics()
@@ -0,0 +1,82 @@
+
+import pytest
+
+blueprint_txt = """
+
+	object Item {
+		sku: String,
+		quantity: Integer (min=1),
+		optional note: String
+	}
+
+	root {
+		order: Integer,
+		items: Item[]
+	}
+
+"""
+
+json_txt = """
+
+{
+	"order": 42,
+	"items": [
+		{ "sku": "A-1", "quantity": 3 },
+		{ "sku": "B-2", "quantity": 1, "note": "gift" }
+	]
+}
+
+"""
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+def testRecordOutput():
+	blueprint = jsonbp.load_string(blueprint_txt)
+	records = blueprint.with_output(objects=jsonbp.ObjectOutput.RECORD)
+
+	success, outcome = records.deserialize(json_txt)
+	assert success and isinstance(outcome, jsonbp.JsonRecord)
+	assert not hasattr(outcome, '__dict__')
+
+	first, second = outcome.items
+	assert type(first) is type(second)
+	assert first.sku == "A-1" and first.quantity == 3
+	assert getattr(first, 'note', None) is None and second.note == "gift"
+
+	_, asDicts = blueprint.deserialize(json_txt)
+	assert outcome._asdict()['order'] == asDicts['order']
+	assert [item._asdict() for item in outcome.items] == asDicts['items']
+
+	serialized = records.serialize(outcome)
+	assert serialized == blueprint.serialize(asDicts)
+	assert records.deserialize(serialized) == (True, outcome)
+
+	with pytest.raises(jsonbp.SerializationException):
+		records.serialize({"order": 1, "items": [42]})
+
+
+def testUnfitFields():
+	# record types are generated when deriving, for every declared object
+	blueprint = jsonbp.load_string('object Hidden { __secret: Integer } root { visible: Integer }')
+	assert blueprint.deserialize('{"visible": 1}') == (True, {"visible": 1})
+
+	with pytest.raises(jsonbp.SchemaViolation):
+		blueprint.with_output(objects=jsonbp.ObjectOutput.RECORD)
+
+	# nor can fields take the place of what records rely upon
+	for field_name in ('_fields', '_asdict', '__eq__'):
+		blueprint = jsonbp.load_string(f'root {{ {field_name}: Integer }}')
+		with pytest.raises(jsonbp.SchemaViolation):
+			blueprint.with_output(objects=jsonbp.ObjectOutput.RECORD)
+
+	blueprint = jsonbp.load_string('root { _private: Integer, fields: Integer }')
+	records = blueprint.with_output(objects=jsonbp.ObjectOutput.RECORD)
+	success, outcome = records.deserialize('{"_private": 1, "fields": 2}')
+	assert success and outcome._asdict() == {"_private": 1, "fields": 2}
+
+
+if __name__ == "__main__":
+	testRecordOutput()
+	testUnfitFields()
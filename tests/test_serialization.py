@@ -75,6 +75,10 @@ import sys
 sys.path.append('..')
 import jsonbp
 
+encodings = [('json', None), ('json', 4)]
+if 'orjson' in jsonbp.backend._backends:
+	encodings += [('orjson', None), ('orjson', 2)]
+
 def testSerializations():
 	verified = 1
 
@@ -104,10 +108,20 @@ def testSerializations():
 					success, outcome = blueprint.deserialize(serialized)
 					assert success and outcome == data['input']
 
+					for backend, indent in encodings:
+						jsonbp.use_json_backend(backend)
+						try: encoded = blueprint.encode(data['input'], indent=indent)
+						finally: jsonbp.use_json_backend('json')
+
+						assert blueprint.deserialize(encoded) == (True, outcome)
+
 				else:
 					with pytest.raises(jsonbp.SerializationException):
 						serialized = blueprint.serialize(data['input'])
 
+					with pytest.raises(jsonbp.SerializationException):
+						blueprint.encode(data['input'])
+
 			print("OK")
 			verified += 1
 
@@ -0,0 +1,48 @@
+import json
+import pytest
+
+import sys
+sys.path.append('..')
+import jsonbp
+from jsonbp.stream import ArrayStream
+
+decoder = json.JSONDecoder(parse_constant=str)
+
+def stream(text, chunk_size):
+	return ArrayStream(text.encode('utf-8'), decoder, chunk_size)
+
+
+def testSmallChunks():
+	text = '[1.5e-10, -Infinity, "caf\\u00e9 \\"x\\"", {"a": [null, true, false]}, 12345, NaN]'
+	expected = decoder.decode(text)
+
+	# values cut anywhere by the window are still read whole
+	for chunk_size in range(1, 9):
+		elements = stream(text, chunk_size)
+		assert list(elements) == expected
+		elements.close()
+
+
+def testWindowGrowth():
+	# a problem far from the window's end doesn't need the rest of the text
+	text = '[tru' + ', 1' * 140000 + ']'
+	elements = stream(text, 64)
+
+	with pytest.raises(json.JSONDecodeError) as raised:
+		list(elements)
+
+	assert raised.value.msg == 'Expecting value' and raised.value.colno == 2
+	assert len(elements.text) < 1024
+	elements.close()
+
+	elements = stream('[1, "unterminated' + ', 1' * 1000 + ']', 64)
+	with pytest.raises(json.JSONDecodeError) as raised:
+		list(elements)
+
+	assert raised.value.msg.startswith('Unterminated string')
+	elements.close()
+
+
+if __name__ == "__main__":
+	testSmallChunks()
+	testWindowGrowth()
@@ -0,0 +1,92 @@
+
+from datetime import date, datetime, timezone, timedelta
+import os
+import tempfile
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+def _delta(before, after):
+	return {name: {memo: {key: after[name][memo][key] - before[name][memo][key]
+		for key in ('hits', 'misses')} for memo in after[name]}
+		for name in after}
+
+
+def testTypeMemos():
+	blueprint = jsonbp.load_string('''
+		root {
+			moment: Instant,
+			custom: Instant (iso=false, format="%Y%m%d %H%M%S %z"),
+			uncached: Instant (cache=false),
+			day: Date
+		}[]
+	''')
+
+	# memos are shared by the whole process, so only their changes are
+	# looked at (values of other tests may be remembered already)
+	before = blueprint.type_statistics()
+	assert set(before) == {'Instant', 'Date'}
+
+	instance = '{"moment": "1984-05-06T10:11:12.000+00:00", "custom": "19840506 101112 +0000", "uncached": "1984-05-06T10:11:12", "day": "1984-05-06"}'
+	success, outcome = blueprint.deserialize(f'[{instance}, {instance}, {instance}]')
+	assert success
+
+	# the uncached field doesn't show up at all
+	statistics = _delta(before, blueprint.type_statistics())
+	assert statistics['Instant']['parse'] == {'hits': 4, 'misses': 2}
+	assert statistics['Date']['parse'] == {'hits': 2, 'misses': 1}
+
+	# equal instants in distinct timezones are written apart
+	utc = datetime(2024, 5, 6, 10, 11, 12, tzinfo=timezone.utc)
+	shifted = utc.astimezone(timezone(timedelta(hours=-3)))
+	assert utc == shifted
+
+	content = [dict(outcome[0], moment=utc), dict(outcome[0], moment=shifted)]
+	serialized = blueprint.serialize(content)
+	assert '"2024-05-06T10:11:12.000+00:00"' in serialized
+	assert '"2024-05-06T07:11:12.000-03:00"' in serialized
+
+	success, again = blueprint.deserialize(serialized)
+	assert success and again == content
+
+	statistics = _delta(before, blueprint.type_statistics())
+	assert statistics['Date']['format']['hits'] == 1
+
+
+def testMemosSharedByLoads():
+	# a separate load reuses the values remembered by the first one,
+	# and both report the same statistics
+	first = jsonbp.load_string('root { at: Instant }')
+	second = jsonbp.load_string('root { at: Instant, note: String }')
+
+	before = first.type_statistics()
+	assert first.deserialize('{"at": "1985-05-06T10:11:12"}')[0]
+	assert second.deserialize('{"at": "1985-05-06T10:11:12", "note": ""}')[0]
+
+	assert first.type_statistics() == second.type_statistics()
+	statistics = _delta(before, second.type_statistics())
+	assert statistics['Instant']['parse'] == {'hits': 1, 'misses': 1}
+
+	# values read through objects of included files count as well
+	with tempfile.TemporaryDirectory() as directory:
+		with open(os.path.join(directory, 'stamp.jbp'), 'w') as fd:
+			fd.write('object Stamp { at: Instant }')
+
+		blueprintPath = os.path.join(directory, 'blueprint.jbp')
+		with open(blueprintPath, 'w') as fd:
+			fd.write('include "stamp.jbp"\nroot { stamp: Stamp }')
+
+		blueprint = jsonbp.load_file(blueprintPath)
+
+	before = blueprint.type_statistics()
+	assert blueprint.deserialize('{"stamp": {"at": "1985-05-06T10:11:12"}}')[0]
+
+	statistics = _delta(before, blueprint.type_statistics())
+	assert statistics['Instant']['parse'] == {'hits': 1, 'misses': 0}
+	assert blueprint.type_statistics() == first.type_statistics()
+
+
+if __name__ == "__main__":
+	testTypeMemos()
+	testMemosSharedByLoads()
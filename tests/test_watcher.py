@@ -0,0 +1,123 @@
+
+import os
+import time
+import tempfile
+import threading
+
+import sys
+sys.path.append('..')
+import jsonbp
+
+def write(path, contents):
+	with open(path, 'w') as fd:
+		fd.write(contents)
+
+
+def waitFor(event):
+	assert event.wait(5), "watcher didn't notice the change"
+	event.clear()
+
+
+def testWatcher():
+	jsonbp.invalidate_cache()
+
+	with tempfile.TemporaryDirectory() as directory:
+		typesFile = os.path.join(directory, 'types.jbp')
+		rootFile = os.path.join(directory, 'root.jbp')
+		write(typesFile, 'type Amount : Integer (min=0)\n')
+		write(rootFile, 'include "types.jbp"\nroot { amount: Amount }\n')
+
+		original = jsonbp.load_file(rootFile)
+		assert not original.deserialize('{"amount": -5}')[0]
+
+		reloaded = threading.Event()
+		failed = threading.Event()
+		reloads, failures = list(), list()
+
+		def onReload(paths):
+			reloads.append(paths)
+			reloaded.set()
+
+		def onError(paths, error):
+			failures.append((paths, error))
+			failed.set()
+
+		watcher = jsonbp.watch_blueprints(interval=0.05,
+			on_reload=onReload, on_error=onError)
+
+		try:
+			write(typesFile, 'type Amount : Integer (min=-10)\n')
+			waitFor(reloaded)
+
+			assert sorted(reloads[-1]) == sorted([rootFile, typesFile])
+			current = jsonbp.load_file(rootFile)
+			assert current is not original
+			assert current.deserialize('{"amount": -5}') == (True, {"amount": -5})
+
+			# blueprints in use remain as they were
+			assert not original.deserialize('{"amount": -5}')[0]
+
+			# broken files keep the last good blueprint
+			write(typesFile, 'type Amount : Integer (min=\n')
+			waitFor(failed)
+			assert jsonbp.load_file(rootFile) is current
+			assert failures[-1][0] == [typesFile]
+
+			write(typesFile, 'type Amount : Integer (min=-100)\n')
+			waitFor(reloaded)
+			assert jsonbp.load_file(rootFile).deserialize('{"amount": -50}')[0]
+
+			# a failing callback is reported, and watching goes on
+			def brokenReload(paths):
+				watcher.on_reload = onReload
+				reloaded.set()
+				raise RuntimeError("broken callback")
+
+			watcher.on_reload = brokenReload
+			write(typesFile, 'type Amount : Integer (min=-1000)\n')
+			waitFor(reloaded)
+
+			write(typesFile, 'type Amount : Integer (min=-10000)\n')
+			waitFor(reloaded)
+			assert jsonbp.load_file(rootFile).deserialize('{"amount": -5000}')[0]
+
+		finally:
+			watcher.stop()
+
+		jsonbp.invalidate_cache()
+
+
+def testChangesBeforeFirstCheck():
+	jsonbp.invalidate_cache()
+
+	with tempfile.TemporaryDirectory() as directory:
+		rootFile = os.path.join(directory, 'root.jbp')
+		write(rootFile, 'root { amount: Integer (min=0) }\n')
+
+		watcher = jsonbp.watcher.BlueprintWatcher(interval=0.05, use_inotify=False)
+		try:
+			# files are compared to what was loaded, not to what the first check saw
+			original = jsonbp.load_file(rootFile)
+			write(rootFile, 'root { amount: Integer (min=-100) }\n')
+			assert watcher.check() == [rootFile]
+			assert jsonbp.load_file(rootFile) is not original
+			assert watcher.check() == []
+
+			# without inotify, the thread polls
+			reloaded = threading.Event()
+			watcher.on_reload = lambda paths: reloaded.set()
+			watcher._thread.start()
+
+			write(rootFile, 'root { amount: Integer (min=-1000) }\n')
+			waitFor(reloaded)
+			assert jsonbp.load_file(rootFile).deserialize('{"amount": -500}')[0]
+
+		finally:
+			watcher.stop()
+
+		jsonbp.invalidate_cache()
+
+
+if __name__ == "__main__":
+	testWatcher()
+	testChangesBeforeFirstCheck()